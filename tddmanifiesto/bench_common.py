@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Shared pieces of the benchmark harnesses.
+
+Builds the JSON report, declares the ``run`` output options and the
+``compare`` subcommand, and pairs two reports to flag regressions, so every
+``bench_*`` module reads and writes the same format.
+"""
+
+import datetime
+import json
+import platform
+
+
+def make_report(results: list, repeat: int) -> dict:
+    """Wrap ``results`` with the interpreter, platform, date and ``repeat``."""
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def write_report(report: dict, path=None) -> None:
+    """Write ``report`` as JSON to ``path``, or to stdout without one."""
+    text = json.dumps(report, indent=2)
+    if path:
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+def add_output_arguments(run) -> None:
+    """``--repeat`` and ``--output`` options of a ``run`` subcommand."""
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--output", help="JSON file (default: stdout)")
+
+
+def add_compare_command(commands) -> None:
+    """The ``compare old.json new.json`` subcommand."""
+    compare = commands.add_parser("compare", help="flag regressions between runs")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--threshold", type=float, default=0.10)
+
+
+def _result_key(result: dict) -> tuple:
+    """Identify a measurement by function and input shape."""
+    return (result["function"],) + tuple(sorted(result["shape"].items()))
+
+
+def compare_results(old: dict, new: dict, threshold: float = 0.10) -> list:
+    """
+    Pair the measurements of two reports and return one row per pair with
+    the time and memory ratios (new / old) and whether either regressed by
+    more than ``threshold``.
+    """
+    previous = {_result_key(result): result for result in old["results"]}
+    rows = []
+    for result in new["results"]:
+        before = previous.get(_result_key(result))
+        if before is None:
+            continue
+        time_ratio = result["seconds"] / before["seconds"] if before["seconds"] else 1
+        memory_ratio = (
+            result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else 1
+        )
+        rows.append(
+            {
+                "function": result["function"],
+                "shape": result["shape"],
+                "time_ratio": time_ratio,
+                "memory_ratio": memory_ratio,
+                "regression": time_ratio > 1 + threshold
+                or memory_ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def compare_files(old_path: str, new_path: str, threshold: float = 0.10) -> int:
+    """
+    Print one line per paired measurement of two JSON reports and return
+    the exit status: 1 when a regression is found, 0 otherwise.
+    """
+    with open(old_path, encoding="utf-8") as old, open(
+        new_path, encoding="utf-8"
+    ) as new:
+        rows = compare_results(json.load(old), json.load(new), threshold)
+    width = max((len(row["function"]) for row in rows), default=0)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else "ok"
+        print(
+            f"{flag:10} {row['function']:{width}} time x{row['time_ratio']:.2f} "
+            f"mem x{row['memory_ratio']:.2f} {json.dumps(row['shape'])}"
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Differential benchmark for the FizzBuzz implementations.
+
+Checks that every FizzBuzz function in ``tdd.exercises`` and
+``tddmanifiesto.class_fizzbuzz`` agrees with ``fizz_buzz`` wherever their
+specs overlap, and times them over ranges of numbers of growing size,
+recording ns per call and memory per call to JSON.
+
+Usage:
+    python -m tddmanifiesto.bench_fizzbuzz check --start 1 --stop 100000
+    python -m tddmanifiesto.bench_fizzbuzz run --output new.json
+    python -m tddmanifiesto.bench_fizzbuzz compare old.json new.json
+"""
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+
+from tddmanifiesto.bench_common import (
+    add_compare_command,
+    add_output_arguments,
+    compare_files,
+    make_report,
+    write_report,
+)
+from tddmanifiesto.class_fizzbuzz import (
+    FIZZ_BUZZ_RULES,
+    FIZZ_BUZZ_VARIANTS,
+    fizz_buzz,
+    fizz_buzz_range,
+    write_fizz_buzz,
+)
+
+# Funciones de un número: las variantes del repositorio y el motor de reglas
+NUMBER_FUNCTIONS = dict(FIZZ_BUZZ_VARIANTS, rules=FIZZ_BUZZ_RULES)
+
+# Números donde cada variante incompleta cumple la especificación final
+DOMAINS = {
+    "iteration1": lambda n: n % 5 != 0,
+    "iteration2": lambda n: n % 15 != 0,
+}
+
+
+def _render_with_writer(start: int, stop: int) -> str:
+    """write_fizz_buzz a memoria, decodificado para compararlo."""
+    output = io.BytesIO()
+    write_fizz_buzz(output, start, stop)
+    return output.getvalue().decode("ascii")
+
+
+# Funciones que generan un rango completo como texto de líneas
+RANGE_FUNCTIONS = {
+    "fizz_buzz_range": fizz_buzz_range,
+    "write_fizz_buzz": _render_with_writer,
+    "rules.labels": lambda start, stop: "".join(
+        label + "\n" for label in FIZZ_BUZZ_RULES.labels(start, stop)
+    ),
+}
+
+
+def check_equivalence(start: int, stop: int) -> list:
+    """
+    Compare every function with ``fizz_buzz`` on ``[start, stop)``.
+    Returns one ``(function, n, expected, got)`` row per disagreement
+    inside the function's domain; range functions report ``n`` = None.
+    """
+    mismatches = []
+    expected = [fizz_buzz(n) for n in range(start, stop)]
+    for name, function in NUMBER_FUNCTIONS.items():
+        in_domain = DOMAINS.get(name, lambda n: True)
+        for n, label in zip(range(start, stop), expected):
+            if in_domain(n) and function(n) != label:
+                mismatches.append((name, n, label, function(n)))
+
+    text = "".join(label + "\n" for label in expected)
+    for name, function in RANGE_FUNCTIONS.items():
+        rendered = function(start, stop)
+        if rendered != text:
+            mismatches.append((name, None, len(text), len(rendered)))
+    return mismatches
+
+
+def _time_numbers(function, start: int, count: int) -> float:
+    """Wall time of calling ``function`` on ``count`` consecutive numbers."""
+    numbers = range(start, start + count)
+    begin = time.perf_counter()
+    for n in numbers:
+        function(n)
+    return time.perf_counter() - begin
+
+
+def _time_range(function, start: int, count: int) -> float:
+    """Wall time of rendering ``count`` numbers in one range call."""
+    begin = time.perf_counter()
+    function(start, start + count)
+    return time.perf_counter() - begin
+
+
+def memory_per_call(function, start: int, count: int, per_number: bool) -> tuple:
+    """
+    Memory blocks each call leaves allocated (its result) and the largest
+    number of bytes a single call had allocated at its peak, both measured
+    with ``tracemalloc`` around the calls themselves.
+    """
+    if per_number:
+        calls = [(n,) for n in range(start, start + count)]
+    else:
+        calls = [(start, start + count)]
+    results = [None] * len(calls)
+    peak = 0
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for position, arguments in enumerate(calls):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        results[position] = function(*arguments)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del results
+    return blocks / count, peak
+
+
+def measure(name: str, start: int, count: int, repeat: int) -> dict:
+    """Best-of-``repeat`` timing plus memory per call for one function and shape."""
+    per_number = name in NUMBER_FUNCTIONS
+    if per_number:
+        function, timer = NUMBER_FUNCTIONS[name], _time_numbers
+    else:
+        function, timer = RANGE_FUNCTIONS[name], _time_range
+    seconds = min(timer(function, start, count) for _ in range(repeat))
+    retained_blocks, peak = memory_per_call(function, start, count, per_number)
+    return {
+        "function": name,
+        "shape": {"start": start, "count": count},
+        "seconds": seconds,
+        "ns_per_call": seconds / count * 1e9,
+        "retained_blocks_per_call": retained_blocks,
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(starts: list, counts: list, functions: list, repeat: int = 5):
+    """
+    Time every function at each (start, count) pair and return the JSON
+    report. Growing ``starts`` gives the curve over number size and growing
+    ``counts`` the curve over range length.
+    """
+    results = [
+        measure(name, start, count, repeat)
+        for start in starts
+        for count in counts
+        for name in functions
+    ]
+    return make_report(results, repeat)
+
+
+def _parse_args(argv):
+    """Command line for the ``check``, ``run`` and ``compare`` subcommands."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    names = list(NUMBER_FUNCTIONS) + list(RANGE_FUNCTIONS)
+
+    check = commands.add_parser("check", help="compare every function with fizz_buzz")
+    check.add_argument("--start", type=int, default=-1000)
+    check.add_argument("--stop", type=int, default=100000)
+
+    run = commands.add_parser("run", help="time the FizzBuzz functions")
+    run.add_argument("--starts", type=int, nargs="+", default=[1, 10**6, 10**12])
+    run.add_argument("--counts", type=int, nargs="+", default=[1000, 100000])
+    run.add_argument("--functions", nargs="+", choices=names, default=names)
+    add_output_arguments(run)
+    add_compare_command(commands)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Entry point; ``check`` exits with 1 on a disagreement and ``compare``
+    with 1 when a regression is found.
+    """
+    args = _parse_args(argv)
+    if args.command == "check":
+        mismatches = check_equivalence(args.start, args.stop)
+        for name, n, expected, got in mismatches:
+            print(f"MISMATCH {name} n={n}: expected {expected!r}, got {got!r}")
+        print(f"{len(mismatches)} mismatches in [{args.start}, {args.stop})")
+        return 1 if mismatches else 0
+
+    if args.command == "run":
+        report = run_benchmarks(args.starts, args.counts, args.functions, args.repeat)
+        write_report(report, args.output)
+        return 0
+    return compare_files(args.old, args.new, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
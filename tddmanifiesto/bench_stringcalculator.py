@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark harness for the String Calculator versions.
+
+Times ``add`` through ``add_v9`` on generated inputs, records throughput and
+peak memory to JSON and compares two result files to flag regressions.
+
+Usage:
+    python -m tddmanifiesto.bench_stringcalculator run --output new.json
+    python -m tddmanifiesto.bench_stringcalculator compare old.json new.json
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+import tracemalloc
+
+from tddmanifiesto import class_stringcalculator
+from tddmanifiesto.bench_common import (
+    add_compare_command,
+    add_output_arguments,
+    compare_files,
+    make_report,
+    write_report,
+)
+
+# Función -> versión, para saber qué formas de entrada soporta cada una
+VERSIONS = {
+    "add": 1,
+    "add_v2": 2,
+    "add_v3": 3,
+    "add_v4": 4,
+    "add_v5": 5,
+    "add_v6": 6,
+    "add_v7": 7,
+    "add_v8": 8,
+    "add_v9": 9,
+}
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def make_input(
+    tokens: int,
+    width: int = 3,
+    delimiter_length: int = 0,
+    negative_ratio: float = 0.0,
+    mixed_position=None,
+    seed: int = 0,
+) -> str:
+    """
+    Build a calculator input with ``tokens`` numbers of ``width`` digits.
+    ``delimiter_length`` 0 uses ','; otherwise a ``//`` header
+    with a delimiter of that many '*'. ``negative_ratio`` of the numbers are
+    negated and ``mixed_position`` (0..1) swaps one delimiter for a ','.
+    """
+    rng = random.Random(seed)
+    low = 10 ** (width - 1) if width > 1 else 0
+    numbers = [rng.randint(low, 10**width - 1) for _ in range(tokens)]
+    for index in range(tokens):
+        if rng.random() < negative_ratio:
+            numbers[index] = -numbers[index]
+
+    if delimiter_length == 0:
+        separators = [","] * (tokens - 1)
+        header = ""
+    else:
+        delimiter = "*" * delimiter_length
+        separators = [delimiter] * (tokens - 1)
+        header = f"//{delimiter}\n"
+
+    if mixed_position is not None and separators:
+        index = min(int(mixed_position * len(separators)), len(separators) - 1)
+        separators[index] = ","
+
+    parts = [str(numbers[0])] if tokens else []
+    for separator, number in zip(separators, numbers[1:]):
+        parts.append(separator)
+        parts.append(str(number))
+    return header + "".join(parts)
+
+
+def supports(version: int, shape: dict) -> bool:
+    """Whether a calculator version is meant to handle an input shape."""
+    if version == 1 and shape["tokens"] > 2:
+        return False
+    if shape["delimiter_length"] and version < 5:
+        return False
+    if shape["mixed_position"] is not None and version < 7:
+        return False
+    return True
+
+
+def _time_calls(function, numbers: str, calls: int) -> float:
+    """Wall time of ``calls`` consecutive calls; ValueErrors count as results."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        try:
+            function(numbers)
+        except ValueError:
+            pass
+    return time.perf_counter() - start
+
+
+def time_call(function, numbers: str, repeat: int, min_time: float = 0.01) -> float:
+    """
+    Best per-call time over ``repeat`` samples. Each sample loops enough
+    calls to last ``min_time`` seconds so tiny inputs are not timer noise.
+    """
+    calls = 1
+    while _time_calls(function, numbers, calls) < min_time:
+        calls *= 10
+    return min(_time_calls(function, numbers, calls) for _ in range(repeat)) / calls
+
+
+def peak_memory(function, numbers: str) -> int:
+    """Peak bytes allocated by one call, measured with ``tracemalloc``."""
+    tracemalloc.start()
+    try:
+        function(numbers)
+    except ValueError:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def iter_shapes(args) -> list:
+    """Cartesian product of the shape parameters given on the command line."""
+    shapes = []
+    for tokens, width, delimiter_length, ratio, mixed in itertools.product(
+        args.tokens,
+        args.widths,
+        args.delimiter_lengths,
+        args.negative_ratios,
+        args.mixed_positions,
+    ):
+        if mixed is not None and delimiter_length == 0:
+            # Con ',' como delimitador no hay mezcla posible
+            continue
+        shapes.append(
+            {
+                "tokens": tokens,
+                "width": width,
+                "delimiter_length": delimiter_length,
+                "negative_ratio": ratio,
+                "mixed_position": mixed,
+            }
+        )
+    return shapes
+
+
+def run_benchmarks(shapes: list, functions: list, repeat: int = 5) -> dict:
+    """Time every supported (function, shape) pair and return the JSON report."""
+    results = []
+    for shape in shapes:
+        numbers = make_input(**shape)
+        for name in functions:
+            if not supports(VERSIONS[name], shape):
+                continue
+            function = getattr(class_stringcalculator, name)
+            seconds = time_call(function, numbers, repeat)
+            results.append(
+                {
+                    "function": name,
+                    "shape": shape,
+                    "bytes": len(numbers),
+                    "seconds": seconds,
+                    "mb_per_s": len(numbers) / seconds / 1e6 if seconds else None,
+                    "tokens_per_s": shape["tokens"] / seconds if seconds else None,
+                    "peak_bytes": peak_memory(function, numbers),
+                }
+            )
+    return make_report(results, repeat)
+
+
+def _mixed_position(value: str):
+    """argparse type: 'none' or a fraction between 0 and 1."""
+    return None if value.lower() == "none" else float(value)
+
+
+def _parse_args(argv):
+    """Command line for the ``run`` and ``compare`` subcommands."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the calculator versions")
+    run.add_argument("--tokens", type=int, nargs="+", default=[2, 1000, 100000])
+    run.add_argument("--widths", type=int, nargs="+", default=[1, 4])
+    run.add_argument("--delimiter-lengths", type=int, nargs="+", default=[0, 1, 3])
+    run.add_argument("--negative-ratios", type=float, nargs="+", default=[0.0, 0.01])
+    run.add_argument(
+        "--mixed-positions", type=_mixed_position, nargs="+", default=[None, 0.5]
+    )
+    run.add_argument("--functions", nargs="+", choices=VERSIONS, default=list(VERSIONS))
+    add_output_arguments(run)
+    add_compare_command(commands)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Entry point; ``compare`` exits with 1 when a regression is found."""
+    args = _parse_args(argv)
+    if args.command == "run":
+        write_report(
+            run_benchmarks(iter_shapes(args), args.functions, args.repeat), args.output
+        )
+        return 0
+    return compare_files(args.old, args.new, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,16 @@ FizzBuzz implementations - TDD iterations.
 Cada función representa una iteración del ciclo Red-Green-Refactor.
 """
 
+import collections
+import functools
+import itertools
+import math
+import os
+import time
+
+from tdd.exercises import fizzbuzz as exercises_fizzbuzz
+from tddmanifiesto.pooling import ordered_submit, pool_window, process_pool
+
 
 def iteration1_fizzbuzz(n):
     """
@@ -51,3 +61,356 @@ def fizz_buzz(n):
         result += "Buzz"
 
     return result or str(n)
+
+
+# La salida de FizzBuzz se repite cada 15 números
+CYCLE = 15
+# Números por bloque renderizado; múltiplo de CYCLE para no cambiar de fase
+BLOCK_SIZE = CYCLE * 4096
+
+
+def _cycle_lines(phase):
+    """
+    Plantillas de las 15 líneas que empiezan en el residuo ``phase``, con
+    ``%d`` donde va el número, y la máscara de esas posiciones.
+    """
+    lines = []
+    for offset in range(CYCLE):
+        label = fizz_buzz(phase + offset)
+        lines.append(label + "\n" if label.isalpha() else "%d\n")
+    mask = tuple(line == "%d\n" for line in lines)
+    return tuple(lines), mask
+
+
+_CYCLE_LINES = tuple(_cycle_lines(phase) for phase in range(CYCLE))
+# Las mismas plantillas en bytes, para escribir sin pasar por str
+_CYCLE_BYTES = tuple(
+    (tuple(line.encode("ascii") for line in lines), mask)
+    for lines, mask in _CYCLE_LINES
+)
+
+
+def _render_block(start, stop, cycle_lines=_CYCLE_LINES):
+    """
+    Líneas de ``start`` a ``stop - 1`` en un solo formateo: la plantilla del
+    ciclo se repite y los números se eligen con la máscara, sin bucle Python
+    por número. Con ``_CYCLE_BYTES`` el resultado es ``bytes``.
+    """
+    lines, mask = cycle_lines[start % CYCLE]
+    full, rest = divmod(stop - start, CYCLE)
+    empty = lines[0][:0]
+    template = empty.join(lines) * full + empty.join(lines[:rest])
+    numbers = tuple(itertools.compress(range(start, stop), itertools.cycle(mask)))
+    return template % numbers
+
+
+def iter_fizz_buzz_blocks(start, stop, block_size=BLOCK_SIZE):
+    """
+    Genera la salida de ``start`` a ``stop - 1`` en bloques de hasta
+    ``block_size`` líneas, cada una terminada en salto de línea.
+    """
+    for block_start in range(start, stop, block_size):
+        yield _render_block(block_start, min(block_start + block_size, stop))
+
+
+def fizz_buzz_range(start, stop, lazy=False):
+    """
+    FizzBuzz para todos los números de ``start`` a ``stop - 1``.
+    Devuelve un único texto con una línea por número, o con ``lazy`` un
+    iterador de etiquetas que se renderiza bloque a bloque.
+    """
+    blocks = iter_fizz_buzz_blocks(start, stop)
+    if lazy:
+        return itertools.chain.from_iterable(map(str.splitlines, blocks))
+    return "".join(blocks)
+
+
+def _write_all(target, data):
+    """Escribe ``data`` completo en un descriptor o un archivo binario."""
+    if isinstance(target, int):
+        while data:
+            data = data[os.write(target, data) :]
+    else:
+        target.write(data)
+
+
+def write_fizz_buzz(target, start, stop, buffer_size=1 << 16):
+    """
+    Escribe las líneas de ``start`` a ``stop - 1`` en ``target`` (un
+    descriptor de archivo o un archivo binario) sin crear un str por número.
+    Los bloques se formatean directo en bytes y se acumulan en un único
+    bytearray de ``buffer_size`` que se vacía con escrituras grandes, así que
+    la memoria no crece con el rango. Devuelve los bytes escritos.
+    """
+    # Cota del largo de línea para que cada bloque quepa en el búfer
+    digits = len(str(max(abs(start), abs(stop - 1), 1)))
+    width = max(digits + 2, len("FizzBuzz\n"))
+    block_size = max(buffer_size // width // CYCLE, 1) * CYCLE
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    fill = 0
+    written = 0
+    for block_start in range(start, stop, block_size):
+        block = _render_block(
+            block_start, min(block_start + block_size, stop), _CYCLE_BYTES
+        )
+        if fill + len(block) > buffer_size:
+            _write_all(target, view[:fill])
+            fill = 0
+        if len(block) > buffer_size:
+            # Solo con búferes menores que un ciclo
+            _write_all(target, block)
+        else:
+            view[fill : fill + len(block)] = block
+            fill += len(block)
+        written += len(block)
+    _write_all(target, view[:fill])
+    view.release()
+    return written
+
+
+def _render_chunk(start, stop):
+    """Bytes de las líneas de ``start`` a ``stop - 1``; corre en el pool."""
+    return b"".join(
+        _render_block(block_start, min(block_start + BLOCK_SIZE, stop), _CYCLE_BYTES)
+        for block_start in range(start, stop, BLOCK_SIZE)
+    )
+
+
+def fizz_buzz_parallel(start, stop, workers=None, chunk_size=1 << 20, executor=None):
+    """
+    Genera la salida de ``start`` a ``stop - 1`` repartida en trozos de
+    ``chunk_size`` números sobre un pool de procesos (``executor``, o uno
+    nuevo con ``workers`` procesos). Los trozos llegan como ``bytes`` en
+    orden y su concatenación es idéntica a la salida secuencial.
+    """
+    chunks = (
+        (chunk_start, min(chunk_start + chunk_size, stop))
+        for chunk_start in range(start, stop, chunk_size)
+    )
+    with process_pool(workers, executor) as pool:
+        yield from ordered_submit(pool, _render_chunk, chunks, pool_window(workers))
+
+
+# Bytes de un ciclo de 15 líneas sin contar los 8 números: 4 Fizz, 2 Buzz y
+# un FizzBuzz, cada uno con su salto de línea
+_CYCLE_LABEL_BYTES = 4 * len("Fizz\n") + 2 * len("Buzz\n") + len("FizzBuzz\n")
+_CYCLE_NUMBERS = 8
+
+
+def _numbered_through(n):
+    """Cuántos de los números de 1 a ``n`` se imprimen como número."""
+    return n - n // 3 - n // 5 + n // 15
+
+
+def _label_bytes_through(n):
+    """Bytes de las líneas Fizz, Buzz y FizzBuzz entre 1 y ``n``."""
+    fizz_buzz_lines = n // 15
+    fizz_or_buzz_lines = n // 3 + n // 5 - 2 * fizz_buzz_lines
+    return 5 * fizz_or_buzz_lines + 9 * fizz_buzz_lines
+
+
+def _bytes_through(n):
+    """Bytes de las líneas 1 a ``n`` de la salida, en forma cerrada."""
+    total = _label_bytes_through(n)
+    digits = 1
+    low = 1
+    # Los números ocupan sus dígitos más el salto de línea, por tramo de dígitos
+    while low <= n:
+        high = min(n, low * 10 - 1)
+        total += (digits + 1) * (_numbered_through(high) - _numbered_through(low - 1))
+        digits += 1
+        low *= 10
+    return total
+
+
+def fizz_buzz_offset(n):
+    """
+    Posición en bytes donde empieza la línea de ``n`` en la salida
+    ``fizz_buzz(1)\\n fizz_buzz(2)\\n ...``, sin generar las anteriores.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    return _bytes_through(n - 1)
+
+
+def fizz_buzz_line_at(offset):
+    """
+    Número cuya línea contiene el byte ``offset``; inversa de
+    ``fizz_buzz_offset``.
+    """
+    if offset < 0:
+        raise ValueError("offset must be >= 0")
+    digits = 1
+    low = 1
+    # Bytes de los números de 1 a low - 1, acumulados tramo a tramo
+    number_bytes = 0
+    while True:
+        high = low * 10 - 1
+        span = (digits + 1) * (_numbered_through(high) - _numbered_through(low - 1))
+        if offset < number_bytes + span + _label_bytes_through(high):
+            break
+        number_bytes += span
+        digits += 1
+        low *= 10
+
+    # Dentro de un tramo, 15 líneas seguidas ocupan siempre lo mismo
+    position = number_bytes + _label_bytes_through(low - 1)
+    cycle_bytes = _CYCLE_NUMBERS * (digits + 1) + _CYCLE_LABEL_BYTES
+    cycles = (offset - position) // cycle_bytes
+    n = low + CYCLE * cycles
+    position += cycles * cycle_bytes
+    while position + len(fizz_buzz(n)) + 1 <= offset:
+        position += len(fizz_buzz(n)) + 1
+        n += 1
+    return n
+
+
+def read_fizz_buzz(offset, size):
+    """
+    ``size`` bytes de la salida a partir de ``offset``, generando solo las
+    líneas que los cubren.
+    """
+    if size <= 0:
+        return b""
+    first = fizz_buzz_line_at(offset)
+    # Ninguna línea ocupa menos de 2 bytes
+    data = _render_block(first, first + size // 2 + 2, _CYCLE_BYTES)
+    skip = offset - fizz_buzz_offset(first)
+    return data[skip : skip + size]
+
+
+# Ciclos más largos que esto no se tabulan; se evalúan con criba
+MAX_CYCLE = 1 << 16
+
+
+class FizzBuzzRules:
+    """
+    Motor de reglas FizzBuzz genérico: cada regla ``(divisor, palabra)``
+    agrega su palabra cuando el número es múltiplo del divisor, en el orden
+    dado. La salida se repite cada mcm(divisores), así que si ese ciclo es
+    pequeño se tabula una vez y cada número cuesta un módulo y una consulta.
+    """
+
+    def __init__(self, rules, max_cycle=MAX_CYCLE):
+        """Compila ``rules``; los divisores deben ser distintos de cero."""
+        self.rules = tuple((abs(divisor), word) for divisor, word in rules)
+        if any(divisor == 0 for divisor, _ in self.rules):
+            raise ValueError("Divisor must be non-zero")
+        self.cycle = math.lcm(*(divisor for divisor, _ in self.rules))
+        self.table = None
+        if self.cycle <= max_cycle:
+            self.table = tuple(self._sieve(0, self.cycle))
+
+    def __call__(self, n):
+        """Etiqueta de ``n``."""
+        if self.table is not None:
+            return self.table[n % self.cycle] or str(n)
+        label = "".join(word for divisor, word in self.rules if n % divisor == 0)
+        return label or str(n)
+
+    def _sieve(self, start, stop):
+        """Palabras de ``start`` a ``stop - 1`` marcando los múltiplos de cada regla."""
+        words = [""] * max(stop - start, 0)
+        for divisor, word in self.rules:
+            for index in range(-start % divisor, len(words), divisor):
+                words[index] += word
+        return words
+
+    def labels(self, start, stop):
+        """Etiquetas de ``start`` a ``stop - 1``."""
+        if self.table is None:
+            words = self._sieve(start, stop)
+        else:
+            phase = start % self.cycle
+            rotated = self.table[phase:] + self.table[:phase]
+            words = list(
+                itertools.islice(itertools.cycle(rotated), max(stop - start, 0))
+            )
+        return [word or str(n) for n, word in zip(range(start, stop), words)]
+
+
+FIZZ_BUZZ_RULES = FizzBuzzRules([(3, "Fizz"), (5, "Buzz")])
+
+
+# Variantes de FizzBuzz del repositorio, por nombre
+FIZZ_BUZZ_VARIANTS = {
+    "exercises": exercises_fizzbuzz,
+    "iteration1": iteration1_fizzbuzz,
+    "iteration2": iteration2_fizzbuzz,
+    "iteration3": iteration3_fizzbuzz,
+    "fizz_buzz": fizz_buzz,
+}
+
+
+class FizzBuzzDispatcher:
+    """
+    Despacha llamadas a una variante de FizzBuzz por nombre. Cada variante
+    se envuelve en una caché LRU acotada que solo se usa para ``n`` en
+    ``[0, memo_limit)``, así los números grandes no desplazan a los más
+    pedidos. Lleva la cuenta de llamadas y un histograma de latencias por
+    variante; registrar otra función con el mismo nombre cambia la
+    implementación sin tocar a quienes la llaman.
+    """
+
+    def __init__(self, variants=None, maxsize=1024, memo_limit=1 << 16):
+        """Registra ``variants`` (por defecto ``FIZZ_BUZZ_VARIANTS``)."""
+        self.maxsize = maxsize
+        self.memo_limit = memo_limit
+        self._variants = {}
+        self._stats = {}
+        for name, function in (variants or FIZZ_BUZZ_VARIANTS).items():
+            self.register(name, function)
+
+    def register(self, name, function):
+        """Agrega o reemplaza una variante; su caché y métricas empiezan de cero."""
+        cached = functools.lru_cache(maxsize=self.maxsize)(function)
+        self._variants[name] = (function, cached)
+        self._stats[name] = {"calls": 0, "latency": collections.Counter()}
+
+    def unregister(self, name):
+        """Quita una variante."""
+        del self._variants[name]
+        del self._stats[name]
+
+    def names(self):
+        """Nombres registrados, en orden de registro."""
+        return list(self._variants)
+
+    def __call__(self, name, n):
+        """Resultado de la variante ``name`` para ``n``."""
+        try:
+            function, cached = self._variants[name]
+        except KeyError:
+            raise KeyError(f"Unknown FizzBuzz variant: {name}") from None
+        if 0 <= n < self.memo_limit:
+            function = cached
+        start = time.perf_counter_ns()
+        result = function(n)
+        elapsed = time.perf_counter_ns() - start
+        stats = self._stats[name]
+        stats["calls"] += 1
+        stats["latency"][elapsed.bit_length()] += 1
+        return result
+
+    def variant(self, name):
+        """Función de un argumento que llama a ``name`` a través del despachador."""
+        return functools.partial(self, name)
+
+    def stats(self, name):
+        """
+        Llamadas, aciertos y fallos de caché, e histograma de latencias como
+        ``{cota superior en ns: llamadas}`` en potencias de dos.
+        """
+        _, cached = self._variants[name]
+        info = cached.cache_info()
+        stats = self._stats[name]
+        return {
+            "calls": stats["calls"],
+            "hits": info.hits,
+            "misses": info.misses,
+            "latency_ns": {
+                1 << bucket: count for bucket, count in sorted(stats["latency"].items())
+            },
+        }
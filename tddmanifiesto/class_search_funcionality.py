@@ -5,24 +5,111 @@ Implementación incremental siguiendo el manifiesto TDD.
 Cada versión cumple con un criterio diferente.
 """
 
-CITY_DB = [
-    "Paris",
-    "Budapest",
-    "Skopje",
-    "Rotterdam",
-    "Valencia",
-    "Vancouver",
-    "Amsterdam",
-    "Vienna",
-    "Sydney",
-    "New York City",
-    "London",
-    "Bangkok",
-    "Hong Kong",
-    "Dubai",
-    "Rome",
-    "Istanbul",
-]
+import bisect
+import collections
+import csv
+import heapq
+import mmap
+import sys
+from array import array
+
+
+class CityDatabase(list):
+    """
+    Lista de ciudades que cuenta sus modificaciones en ``version`` y avisa
+    cada cambio a los índices construidos sobre ella, que lo aplican sin
+    reconstruirse cuando pueden.
+    """
+
+    version = 0
+
+    def _changed(self, removed, added, appended=False) -> None:
+        """
+        Registra un cambio ya hecho: los nombres quitados y agregados (None si
+        no se conocen) y si solo se agregaron al final.
+        """
+        self.version += 1
+        _update_indexes(self, removed, added, appended)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = list(value)
+            removed = self[key]
+        else:
+            removed = (self[key],)
+        super().__setitem__(key, value)
+        self._changed(removed, value if isinstance(key, slice) else (value,))
+
+    def __delitem__(self, key):
+        removed = self[key] if isinstance(key, slice) else (self[key],)
+        super().__delitem__(key)
+        self._changed(removed, ())
+
+    def __iadd__(self, cities):
+        self.extend(cities)
+        return self
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self._changed(None, None)
+        return self
+
+    def append(self, city):
+        super().append(city)
+        self._changed((), (city,), appended=True)
+
+    def extend(self, cities):
+        cities = list(cities)
+        super().extend(cities)
+        self._changed((), cities, appended=True)
+
+    def insert(self, position, city):
+        appended = position >= len(self)
+        super().insert(position, city)
+        self._changed((), (city,), appended)
+
+    def pop(self, position=-1):
+        city = super().pop(position)
+        self._changed((city,), ())
+        return city
+
+    def remove(self, city):
+        super().remove(city)
+        self._changed((city,), ())
+
+    def clear(self):
+        super().clear()
+        self._changed(None, None)
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._changed((), ())
+
+    def reverse(self):
+        super().reverse()
+        self._changed((), ())
+
+
+CITY_DB = CityDatabase(
+    [
+        "Paris",
+        "Budapest",
+        "Skopje",
+        "Rotterdam",
+        "Valencia",
+        "Vancouver",
+        "Amsterdam",
+        "Vienna",
+        "Sydney",
+        "New York City",
+        "London",
+        "Bangkok",
+        "Hong Kong",
+        "Dubai",
+        "Rome",
+        "Istanbul",
+    ]
+)
 
 
 def iteration1_search(search_text: str) -> list:
@@ -81,6 +168,233 @@ def iteration5_search(search_text: str) -> list:
     return [city for city in CITY_DB if search_text in city.lower()]
 
 
+class CityIndex:
+    """
+    Índice de búsqueda por subcadena sobre una lista de ciudades: guarda los
+    nombres ya en minúsculas y, para cada bigrama y trigrama, las posiciones
+    de las ciudades que lo contienen. Una consulta solo revisa las ciudades
+    de la lista de posiciones más corta y respeta el orden original.
+    """
+
+    GRAM_SIZES = (2, 3)
+
+    def __init__(self, cities):
+        """Construye el índice; ``cities`` no se copia."""
+        self.cities = cities
+        self.lowered = []
+        self.postings = {}
+        self.index_appended()
+
+    def index_appended(self) -> None:
+        """
+        Indexa las ciudades agregadas al final de ``cities`` desde la última
+        vez; como sus posiciones son las mayores, las listas de posiciones
+        siguen ordenadas.
+        """
+        postings = self.postings
+        for position in range(len(self.lowered), len(self.cities)):
+            name = self.cities[position].lower()
+            self.lowered.append(name)
+            grams = {
+                name[start : start + size]
+                for size in self.GRAM_SIZES
+                for start in range(len(name) - size + 1)
+            }
+            for gram in grams:
+                positions = postings.get(gram)
+                if positions is None:
+                    positions = postings[gram] = array("L")
+                positions.append(position)
+
+    def update(self, _removed, _added, appended: bool) -> bool:
+        """
+        Aplica un cambio ya hecho en ``cities`` (ver CityDatabase). Solo las
+        altas al final no mueven posiciones; con otro cambio devuelve False
+        y hay que reconstruir.
+        """
+        if not appended:
+            return False
+        self.index_appended()
+        return True
+
+    def candidates(self, text: str):
+        """Posiciones que pueden contener ``text`` (ya en minúsculas)."""
+        size = min(len(text), self.GRAM_SIZES[-1])
+        grams = {text[start : start + size] for start in range(len(text) - size + 1)}
+        shortest = None
+        for gram in grams:
+            positions = self.postings.get(gram)
+            if positions is None:
+                return ()
+            if shortest is None or len(positions) < len(shortest):
+                shortest = positions
+        return shortest
+
+    def find(self, text: str) -> list:
+        """Posiciones, en orden, de las ciudades que contienen ``text`` (en minúsculas)."""
+        candidates = self.candidates(text)
+        if len(text) <= self.GRAM_SIZES[-1]:
+            # El n-grama es la consulta completa: no hace falta verificar
+            return list(candidates)
+        lowered = self.lowered
+        return [position for position in candidates if text in lowered[position]]
+
+    def search(self, search_text: str) -> list:
+        """Mismas reglas y mismo orden que la búsqueda lineal de search_cities."""
+        if search_text == "*":
+            return self.cities
+        if len(search_text) < 2:
+            return []
+        cities = self.cities
+        return [cities[position] for position in self.find(search_text.lower())]
+
+
+class PrefixIndex:
+    """
+    Búsqueda por prefijo sobre arreglos ordenados: uno con los nombres tal
+    cual y otro con pares ``(nombre en minúsculas, nombre)``. Con ``bisect``
+    se llega al primer candidato en O(log n) y los resultados son contiguos,
+    así que cada consulta cuesta O(log n + prefijo + resultados). Admite
+    altas y bajas sin reconstruir.
+    """
+
+    # Cada alta o baja mueve medio arreglo: con más cambios, conviene reordenar
+    MAX_UPDATES = 256
+
+    def __init__(self, cities=()):
+        """Indexa ``cities``; se pueden repetir nombres."""
+        self._names = sorted(cities)
+        self._folded = sorted((city.lower(), city) for city in cities)
+
+    def __len__(self):
+        """Cantidad de nombres indexados."""
+        return len(self._names)
+
+    def insert(self, city: str) -> None:
+        """Agrega ``city`` manteniendo el orden."""
+        bisect.insort(self._names, city)
+        bisect.insort(self._folded, (city.lower(), city))
+
+    def delete(self, city: str) -> None:
+        """Quita una aparición de ``city``; ValueError si no está."""
+        position = bisect.bisect_left(self._names, city)
+        if position == len(self._names) or self._names[position] != city:
+            raise ValueError(f"{city!r} is not indexed")
+        del self._names[position]
+        pair = (city.lower(), city)
+        del self._folded[bisect.bisect_left(self._folded, pair)]
+
+    def update(self, removed, added, _appended: bool) -> bool:
+        """
+        Aplica un cambio de la lista indexada (ver CityDatabase) con bajas y
+        altas sueltas; dónde quedaron en la lista no importa. Si no se
+        conocen los nombres o son más de ``MAX_UPDATES``, devuelve False:
+        reconstruir es más barato.
+        """
+        if removed is None or len(removed) + len(added) > self.MAX_UPDATES:
+            return False
+        for city in removed:
+            self.delete(city)
+        for city in added:
+            self.insert(city)
+        return True
+
+    def search(self, prefix: str, case_sensitive: bool = True) -> list:
+        """
+        Nombres que empiezan con ``prefix``, en orden alfabético (sin
+        distinguir mayúsculas, ordenados por su versión en minúsculas).
+        """
+        if case_sensitive:
+            names = self._names
+            return names[_prefix_range(names, prefix, prefix)]
+
+        prefix = prefix.lower()
+        folded = self._folded
+        return [name for _, name in folded[_prefix_range(folded, (prefix,), prefix)]]
+
+
+def _prefix_range(items: list, low, prefix: str) -> slice:
+    """
+    Tramo de la lista ordenada ``items`` cuyos elementos empiezan con
+    ``prefix``: desde ``low`` hasta el menor texto mayor que todos ellos,
+    que se obtiene incrementando el último carácter del prefijo.
+    """
+    start = bisect.bisect_left(items, low)
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return slice(start, len(items))
+    bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    if isinstance(low, tuple):
+        bound = (bound,)
+    return slice(start, bisect.bisect_left(items, bound))
+
+
+# Índices de CITY_DB por tipo, con la lista y la versión con que se construyeron
+_INDEXES = {}
+
+
+def _update_indexes(cities: CityDatabase, removed, added, appended: bool) -> None:
+    """
+    Aplica a los índices de ``cities`` que estaban al día un cambio recién
+    hecho (ver CityDatabase._changed). Los que no pueden aplicarlo quedan
+    con una versión vieja y se reconstruyen en la próxima consulta.
+    """
+    for factory, (db, built_version, index) in list(_INDEXES.items()):
+        if db is not cities or built_version != cities.version - 1:
+            continue
+        if index.update(removed, added, appended):
+            _INDEXES[factory] = (db, cities.version, index)
+
+
+def _fingerprint(cities) -> tuple:
+    """
+    Huella barata de una lista común: su largo y sus extremos. Solo detecta
+    reemplazos, altas y bajas que cambien alguno de ellos; para que toda
+    modificación en el lugar invalide los índices hay que usar CityDatabase.
+    """
+    if not cities:
+        return (0,)
+    return len(cities), cities[0], cities[-1]
+
+
+def _cached_index(factory):
+    """
+    Índice ``factory(CITY_DB)``, reconstruido si la lista se reemplazó o
+    cambió. Los cambios se detectan por ``CityDatabase.version``; una lista
+    común no los avisa, así que se compara su huella (ver _fingerprint) sin
+    copiarla ni recorrerla.
+    """
+    if isinstance(CITY_DB, CityDatabase):
+        version = CITY_DB.version
+    else:
+        version = _fingerprint(CITY_DB)
+    db, built_version, index = _INDEXES.get(factory, (None, None, None))
+    if db is not CITY_DB or built_version != version:
+        index = factory(CITY_DB)
+        _INDEXES[factory] = (CITY_DB, version, index)
+    return index
+
+
+def city_index() -> CityIndex:
+    """Índice por subcadena de CITY_DB."""
+    return _cached_index(CityIndex)
+
+
+def prefix_index() -> PrefixIndex:
+    """Índice por prefijo de CITY_DB."""
+    return _cached_index(PrefixIndex)
+
+
+def prefix_search(search_text: str, case_sensitive: bool = True) -> list:
+    """
+    Ciudades de CITY_DB que empiezan con el texto, como iteration2_search
+    (o iteration3_search sin ``case_sensitive``), en orden alfabético.
+    """
+    if len(search_text) < 2:
+        return []
+    return prefix_index().search(search_text, case_sensitive)
+
+
 def search_cities(search_text: str) -> list:
     """
     Versión final: combina todas las reglas.
@@ -91,5 +405,341 @@ def search_cities(search_text: str) -> list:
     if len(search_text) < 2:
         return []
 
-    search_text = search_text.lower()
-    return [city for city in CITY_DB if search_text in city.lower()]
+    return city_index().search(search_text)
+
+
+class SearchCache:
+    """
+    Caché LRU de resultados de search_cities para autocompletado. Una
+    consulta nueva parte del resultado guardado de su prefijo más largo
+    ("ams" antes de "amst") si es más chico que los candidatos del índice,
+    porque toda ciudad que contiene "amst" contiene "ams". Se vacía sola
+    cuando CITY_DB cambia.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Caché vacía de hasta ``maxsize`` consultas."""
+        self.maxsize = maxsize
+        self._results = collections.OrderedDict()
+        self._state = None
+        self.hits = 0
+        self.misses = 0
+        self.narrowed = 0
+
+    def clear(self) -> None:
+        """Descarta los resultados guardados."""
+        self._results.clear()
+
+    def info(self) -> dict:
+        """Aciertos, fallos, consultas resueltas desde un prefijo y tamaño."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "narrowed": self.narrowed,
+            "size": len(self._results),
+            "maxsize": self.maxsize,
+        }
+
+    def _positions(self, text: str, index: CityIndex) -> tuple:
+        """Posiciones de las ciudades que contienen ``text``, sin usar la caché directa."""
+        base = None
+        for end in range(len(text) - 1, 1, -1):
+            base = self._results.get(text[:end])
+            if base is not None:
+                break
+        if base is not None and len(base) < len(index.candidates(text)):
+            self.narrowed += 1
+            lowered = index.lowered
+            return tuple(position for position in base if text in lowered[position])
+        return tuple(index.find(text))
+
+    def search(self, search_text: str) -> list:
+        """Mismo resultado que search_cities."""
+        if search_text == "*":
+            return CITY_DB
+        if len(search_text) < 2:
+            return []
+
+        index = city_index()
+        # El índice se reemplaza o, con altas al final, crece: en los dos
+        # casos CITY_DB cambió y los resultados guardados ya no valen
+        state = (index, len(index.lowered))
+        if state != self._state:
+            self._results.clear()
+            self._state = state
+
+        text = search_text.lower()
+        positions = self._results.get(text)
+        if positions is not None:
+            self.hits += 1
+            self._results.move_to_end(text)
+        else:
+            self.misses += 1
+            positions = self._positions(text, index)
+            self._results[text] = positions
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        cities = index.cities
+        return [cities[position] for position in positions]
+
+
+SEARCH_CACHE = SearchCache()
+
+
+def _encode_cursor(key: tuple) -> str:
+    """Cursor opaco con la clave de orden del último resultado entregado."""
+    tier, weight, position = key
+    return f"{tier}:{weight!r}:{position}"
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Clave de orden guardada en un cursor de ranked_search."""
+    try:
+        tier, weight, position = cursor.split(":")
+        # Los pesos enteros se leen como int para no perder precisión
+        if weight.lstrip("-").isdigit():
+            weight = int(weight)
+        else:
+            weight = float(weight)
+        return int(tier), weight, int(position)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+
+
+def _ranked_keys(text, index: CityIndex, weights: dict):
+    """
+    Clave de orden de cada ciudad que contiene ``text``: coincidencia exacta,
+    luego prefijo y luego subcadena; dentro de cada grupo, mayor popularidad
+    primero y después el orden de CITY_DB.
+    """
+    cities = index.cities
+    lowered = index.lowered
+    if text is None:
+        for position, city in enumerate(cities):
+            yield 2, -weights.get(city, 0), position
+        return
+    for position in index.candidates(text):
+        name = lowered[position]
+        if text not in name:
+            continue
+        if name == text:
+            tier = 0
+        elif name.startswith(text):
+            tier = 1
+        else:
+            tier = 2
+        yield tier, -weights.get(cities[position], 0), position
+
+
+# pylint: disable=too-many-arguments
+def ranked_search(
+    search_text: str, limit: int = 10, offset: int = 0, weights=None, cursor=None
+) -> dict:
+    """
+    Una página de resultados de search_cities ordenados por relevancia:
+    exacta, prefijo, subcadena, y a igualdad según ``weights`` (ciudad ->
+    popularidad). Se pagina con ``offset`` o con el ``next_cursor`` de la
+    página anterior. Usa un heap de ``offset + limit`` elementos, así que
+    nunca arma la lista completa de coincidencias.
+    Devuelve ``{"results": [...], "next_cursor": str | None}``.
+    """
+    if search_text != "*" and len(search_text) < 2:
+        return {"results": [], "next_cursor": None}
+
+    index = city_index()
+    text = None if search_text == "*" else search_text.lower()
+    keys = _ranked_keys(text, index, weights or {})
+    if cursor is not None:
+        after = _decode_cursor(cursor)
+        keys = (key for key in keys if key > after)
+
+    top = heapq.nsmallest(offset + limit + 1, keys)
+    page = top[offset : offset + limit]
+    next_cursor = None
+    if len(top) > offset + limit and page:
+        next_cursor = _encode_cursor(page[-1])
+    cities = index.cities
+    return {
+        "results": [cities[position] for _, _, position in page],
+        "next_cursor": next_cursor,
+    }
+
+
+# Formato de la tabla en disco: firma, cantidad de nombres, tres arreglos de
+# enteros de 64 bits little-endian (posiciones en el bloque de minúsculas,
+# posiciones en el bloque de nombres y orden original de cada registro) y los
+# dos bloques UTF-8, con los registros ordenados por nombre en minúsculas
+_TABLE_MAGIC = b"CITYSST1"
+_WORD = 8
+
+
+def _read_names(source_path: str, column=0) -> list:
+    """
+    Nombres de un CSV (``column`` es un índice o el nombre de una columna
+    de la cabecera) o de un texto con un nombre por línea.
+    """
+    with open(source_path, encoding="utf-8", newline="") as source:
+        if not source_path.lower().endswith(".csv"):
+            lines = (line.rstrip("\r\n") for line in source)
+            return [line for line in lines if line]
+        rows = csv.reader(source)
+        if isinstance(column, str):
+            column = next(rows).index(column)
+        return [row[column] for row in rows if len(row) > column and row[column]]
+
+
+def _words(values) -> bytes:
+    """Enteros como arreglo de 64 bits little-endian."""
+    words = array("Q", values)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words.tobytes()
+
+
+def build_city_table(source_path: str, table_path: str, column=0) -> int:
+    """
+    Crea en ``table_path`` la tabla ordenada de los nombres de
+    ``source_path`` para abrirla con ``CityTable``. Devuelve cuántos hay.
+    """
+    names = _read_names(source_path, column)
+    lowered = [name.lower().encode("utf-8") for name in names]
+    order = sorted(
+        range(len(names)), key=lambda position: (lowered[position], position)
+    )
+
+    def offsets(blobs):
+        total = 0
+        yield total
+        for blob in blobs:
+            total += len(blob)
+            yield total
+
+    sorted_lowered = [lowered[position] for position in order]
+    sorted_names = [names[position].encode("utf-8") for position in order]
+    with open(table_path, "wb") as table:
+        table.write(_TABLE_MAGIC)
+        table.write(_words([len(names)]))
+        table.write(_words(offsets(sorted_lowered)))
+        table.write(_words(offsets(sorted_names)))
+        table.write(_words(order))
+        table.writelines(sorted_lowered)
+        table.writelines(sorted_names)
+    return len(names)
+
+
+class CityTable:
+    """
+    Tabla de ciudades en disco abierta con ``mmap``: abrirla no lee los
+    nombres y los procesos que la usan comparten las páginas a través de la
+    caché del sistema operativo. Las búsquedas recorren los bytes del mapa y
+    solo decodifican los nombres que devuelven.
+    """
+
+    def __init__(self, table_path: str):
+        """Abre una tabla creada con ``build_city_table``."""
+        with open(table_path, "rb") as table:
+            self._map = mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_TABLE_MAGIC)] != _TABLE_MAGIC:
+            self._map.close()
+            raise ValueError(f"{table_path} is not a city table")
+
+        start = len(_TABLE_MAGIC)
+        count = self._array(start, 1)[0]
+        start += _WORD
+        self._lower_offsets = self._array(start, count + 1)
+        start += (count + 1) * _WORD
+        self._name_offsets = self._array(start, count + 1)
+        start += (count + 1) * _WORD
+        self._order = self._array(start, count)
+        self._lower_start = start + count * _WORD
+        self._name_start = self._lower_start + self._lower_offsets[count]
+        self._count = count
+
+    def _array(self, start: int, length: int):
+        """Arreglo de ``length`` enteros desde ``start``, sin copiar si se puede."""
+        view = memoryview(self._map)[start : start + length * _WORD]
+        if sys.byteorder == "little":
+            return view.cast("Q")
+        words = array("Q", view)
+        words.byteswap()
+        return words
+
+    def close(self) -> None:
+        """Libera el mapa de memoria."""
+        for name in ("_lower_offsets", "_name_offsets", "_order"):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        """Cantidad de nombres."""
+        return self._count
+
+    def __getitem__(self, record: int) -> str:
+        """Nombre del registro ``record`` en el orden de la tabla."""
+        start = self._name_start + self._name_offsets[record]
+        end = self._name_start + self._name_offsets[record + 1]
+        return self._map[start:end].decode("utf-8")
+
+    def _lowered(self, record: int) -> bytes:
+        """Nombre en minúsculas del registro, en UTF-8."""
+        start = self._lower_start + self._lower_offsets[record]
+        return self._map[start : self._lower_start + self._lower_offsets[record + 1]]
+
+    def _first(self, key: bytes, inclusive: bool) -> int:
+        """Primer registro cuyo nombre en minúsculas (cortado) es >= o > ``key``."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            value = self._lowered(middle)[: len(key)]
+            if value < key or (not inclusive and value == key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def prefix(self, search_text: str) -> list:
+        """Nombres que empiezan con el texto sin distinguir mayúsculas, en orden."""
+        key = search_text.lower().encode("utf-8")
+        low = self._first(key, True)
+        high = self._first(key, False)
+        return [self[record] for record in range(low, high)]
+
+    def search(self, search_text: str) -> list:
+        """
+        Mismo resultado y mismo orden que search_cities sobre la lista
+        original de nombres.
+        """
+        if search_text == "*":
+            records = range(self._count)
+        elif len(search_text) < 2:
+            return []
+        else:
+            records = self._find(search_text.lower().encode("utf-8"))
+        return [self[record] for record in sorted(records, key=self._order.__getitem__)]
+
+    def _find(self, text: bytes) -> list:
+        """Registros cuyo nombre en minúsculas contiene ``text``."""
+        data = self._map
+        base = self._lower_start
+        offsets = self._lower_offsets
+        end = self._name_start
+        records = []
+        position = data.find(text, base, end)
+        while position >= 0:
+            record = bisect.bisect_right(offsets, position - base) - 1
+            record_end = base + offsets[record + 1]
+            if position + len(text) <= record_end:
+                records.append(record)
+                position = data.find(text, record_end, end)
+            else:
+                # La coincidencia cruza al registro siguiente
+                position = data.find(text, position + 1, end)
+        return records
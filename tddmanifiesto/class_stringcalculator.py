@@ -1,9 +1,31 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
 """
 String Calculator - Refactored for cumulative behavior.
 Each version builds upon the previous ones.
 """
 
+import codecs
+import collections
+import functools
+import itertools
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el camino en Python puro
+    np = None
+
+# Mensajes de error compartidos por add_v8 y sus variantes
+_SEPARATOR_AT_END = "Invalid input: separator at the end"
+_MISSING_HEADER_NEWLINE = "not enough values to unpack (expected 2, got 1)"
+
+# Entradas más cortas se procesan más rápido sin NumPy
+NUMPY_MIN_LENGTH = 1 << 11
+# Dígitos que caben con seguridad en un int64
+_NUMPY_MAX_DIGITS = 18
+
 
 def add(numbers: str) -> int:
     """Version 1 — Up to two comma-separated numbers or empty string."""
@@ -15,10 +37,57 @@ def add(numbers: str) -> int:
     return int(parts[0]) + int(parts[1])
 
 
+def _numpy_parse(text: str, newline: bool = True):
+    """
+    Vectorized parse of plain ``-?digits`` tokens separated by ',' (and
+    '\\n' when ``newline``) into an int64 array. Returns None when NumPy is
+    missing or any token needs the full ``int()`` rules (empty, signs in the
+    middle, spaces, too many digits...), so the caller falls back to Python.
+    """
+    if np is None or not text.isascii():
+        return None
+    if newline:
+        text = text.replace("\n", ",")
+
+    data = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    is_separator = data == ord(",")
+    is_minus = data == ord("-")
+    if not (is_separator | is_minus | (data - ord("0") < 10)).all():
+        return None
+
+    separators = np.flatnonzero(is_separator)
+    starts = np.concatenate(([0], separators + 1))
+    lengths = np.concatenate((separators, [len(data)])) - starts
+    if not lengths.all():
+        return None
+
+    # '-' solo se admite al inicio del token y seguido de dígitos
+    negative = data[starts] == ord("-")
+    if np.count_nonzero(is_minus) != np.count_nonzero(negative):
+        return None
+    if (lengths[negative] < 2).any() or (lengths - negative).max() > _NUMPY_MAX_DIGITS:
+        return None
+
+    return np.fromstring(text, dtype=np.int64, sep=",")
+
+
+def _numpy_total(values) -> int:
+    """Sum an int64 array, switching to Python ints if it could overflow."""
+    if len(values) == 0:
+        return 0
+    if int(np.abs(values).max()) * len(values) < 1 << 63:
+        return int(values.sum())
+    return sum(values.tolist())
+
+
 def add_v2(numbers: str) -> int:
     """Version 2 — Handle unknown number of arguments."""
     if numbers == "":
         return 0
+    if len(numbers) >= NUMPY_MIN_LENGTH:
+        values = _numpy_parse(numbers, newline=False)
+        if values is not None:
+            return _numpy_total(values)
     parts = numbers.split(",")
     return sum(map(int, parts))
 
@@ -27,12 +96,25 @@ def add_v3(numbers: str) -> int:
     """Version 3 — Support commas and newlines."""
     if numbers == "":
         return 0
+    if len(numbers) >= NUMPY_MIN_LENGTH:
+        values = _numpy_parse(numbers)
+        if values is not None:
+            return _numpy_total(values)
     parts = numbers.replace("\n", ",").split(",")
     return sum(map(int, parts))
 
 
-def add_v4(numbers: str) -> int:
-    """Version 4 — Validation: no separator at end."""
+def add_v4(
+    numbers: str, fail_fast: bool = False, validate_only: bool = False
+) -> int | list:
+    """
+    Version 4 — Validation: no separator at end.
+    ``fail_fast`` raises the first error found; ``validate_only`` returns the
+    list of errors without computing the sum.
+    """
+    result = _check_modes(numbers, 4, fail_fast, validate_only)
+    if result is not None:
+        return result
     if numbers == "":
         return 0
     if numbers.endswith(",") or numbers.endswith("\n"):
@@ -41,25 +123,353 @@ def add_v4(numbers: str) -> int:
     return sum(map(int, parts))
 
 
-def add_v5(numbers: str) -> int:
-    """Version 5 — Support custom delimiters."""
+def _first_stray_comma(body: str, delimiter: str, complete: bool = True) -> tuple:
+    """
+    Position of the first ',' not covered by a custom delimiter match (or
+    None), plus the index where the scan resumes if ``body`` is incomplete.
+    Matches are taken left to right without overlapping.
+    """
+    if "," not in delimiter:
+        comma = body.find(",")
+        return (comma if comma >= 0 else None), len(body)
+
+    width = len(delimiter)
+    # Sin el final del cuerpo, una coma cercana al borde podría quedar cubierta
+    end = len(body) if complete else max(len(body) - width + 1, 0)
+    start = 0
+    comma = body.find(",")
+    while 0 <= comma < end:
+        match = body.find(delimiter, start)
+        while 0 <= match and match + width <= comma:
+            start = match + width
+            match = body.find(delimiter, start)
+        if match < 0 or match > comma:
+            return comma, len(body)
+        start = match + width
+        comma = body.find(",", start)
+
+    match = body.find(delimiter, start)
+    while match >= 0:
+        start = match + width
+        match = body.find(delimiter, start)
+    return None, max(start, end)
+
+
+class DelimiterSpec:
+    """
+    Parsing logic for one ``//<delim>`` header, built once and reused
+    through ``DELIMITER_SPECS``.
+    """
+
+    __slots__ = ("delimiter", "comma_in_delimiter", "disjoint", "shardable")
+
+    def __init__(self, header: str):
+        """Compile the spec for ``header`` (the text before the first newline)."""
+        self.delimiter = header[2:]
+        self.comma_in_delimiter = "," in self.delimiter
+        # Se puede cortar el cuerpo en cualquier aparición del delimitador solo
+        # si las apariciones no se solapan y la limpieza de comas no las altera
+        width = len(self.delimiter)
+        self.disjoint = width > 0 and all(
+            self.delimiter[:k] != self.delimiter[-k:] for k in range(1, width)
+        )
+        self.shardable = self.disjoint and (
+            self.delimiter == "," or not self.comma_in_delimiter
+        )
+
+    def split(self, body: str) -> list:
+        """Split ``body`` on the custom delimiter only."""
+        return body.split(self.delimiter)
+
+    def clean(self, body: str) -> str:
+        """Rewrite commas as the custom delimiter so mixed input still parses."""
+        if self.delimiter == "," or "," not in body:
+            return body
+        return body.replace(",", self.delimiter)
+
+    def find_mixed(self, body: str):
+        """Position of the first ',' that is not part of the delimiter, or None."""
+        if not self.comma_in_delimiter:
+            position = body.find(",")
+            return position if position >= 0 else None
+        position, _ = _first_stray_comma(body, self.delimiter)
+        return position
+
+
+class DelimiterSpecCache:
+    """Bounded LRU cache of compiled delimiter specs keyed by header."""
+
+    def __init__(self, maxsize: int = 128, factory=DelimiterSpec):
+        """Create an empty cache holding up to ``maxsize`` headers."""
+        self._factory = factory
+        self._lookup = None
+        self.resize(maxsize)
+
+    def __call__(self, header: str) -> DelimiterSpec:
+        """Return the spec for ``header``, compiling it on a miss."""
+        return self._lookup(header)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity. Cached specs and statistics are discarded."""
+        self._lookup = functools.lru_cache(maxsize=maxsize)(self._factory)
+
+    def clear(self) -> None:
+        """Drop every cached spec and reset the statistics."""
+        self._lookup.cache_clear()
+
+    def info(self):
+        """Hits, misses, maxsize and current size (``functools`` CacheInfo)."""
+        return self._lookup.cache_info()
+
+
+DELIMITER_SPECS = DelimiterSpecCache()
+
+
+# Caracteres que fail_fast separa de una vez antes de mirar los tokens
+FAIL_FAST_CHUNK = 1 << 16
+
+
+def _find_negatives(body: str, tokens) -> list:
+    """Negative numbers among ``tokens``; only tokens with a '-' are parsed."""
+    if "-" not in body:
+        return []
+    negatives = []
+    for token in tokens:
+        if "-" not in token:
+            continue
+        try:
+            n = int(token)
+        except ValueError:
+            continue
+        if n < 0:
+            negatives.append(n)
+    return negatives
+
+
+def _parse_errors(tokens, skip_blank: bool) -> tuple:
+    """
+    The int() error add_v4..add_v6 would raise on ``tokens`` (or None) and
+    the negative numbers.
+    """
+    negatives = []
+    for token in tokens:
+        if skip_blank and not token.strip():
+            continue
+        try:
+            n = int(token)
+        except ValueError as error:
+            return str(error), []
+        if n < 0:
+            negatives.append(n)
+    return None, negatives
+
+
+def _negatives_message(version: int, negatives: list) -> str:
+    """The negatives error of add_v6 (``version`` 6) or add_v7/add_v8."""
+    label = "Negative numbers" if version == 6 else "Negative number(s)"
+    return f"{label} not allowed: {', '.join(map(str, negatives))}"
+
+
+def _parse_header(numbers: str, version: int) -> tuple:
+    """
+    ``(spec, body, error)`` of a non-empty input for add_v4..add_v8, with the
+    error raised before looking at the numbers (missing header newline or
+    separator at the end). add_v4 has no custom delimiter header.
+    """
+    if version >= 5:
+        return _parse_v8_header(numbers)
+    if numbers.endswith(",") or numbers.endswith("\n"):
+        return None, numbers, _SEPARATOR_AT_END
+    return None, numbers, None
+
+
+def _validation_errors(numbers: str, version: int) -> list:
+    """
+    Rule violations add_v4..add_v8 (``version``) would report for ``numbers``,
+    without computing the sum: separator at the end, malformed numbers
+    (v4..v6, which raise the int() error), negatives (v6+) and mixed
+    delimiters (v7+).
+    """
+    if numbers == "":
+        return []
+    spec, body, error = _parse_header(numbers, version)
+    if error is not None:
+        return [error]
+
+    if version < 7:
+        tokens = spec.split(body) if spec else body.replace("\n", ",").split(",")
+        # v4 y v5 convierten todos los tokens; v6 descarta los vacíos
+        error, negatives = _parse_errors(tokens, version == 6)
+        if error:
+            return [error]
+        if version < 6 or not negatives:
+            return []
+        return [_negatives_message(version, negatives)]
+
+    if spec is None:
+        tokens = body.replace("\n", ",").split(",")
+    else:
+        tokens = spec.split(spec.clean(body))
+    errors = []
+    negatives = _find_negatives(body, tokens)
+    if negatives:
+        errors.append(_negatives_message(version, negatives))
+    if spec is not None:
+        position = spec.find_mixed(body)
+        if position is not None:
+            errors.append(
+                f"'{spec.delimiter}' expected but ',' found at position {position}."
+            )
+    return errors
+
+
+def _body_chunks(body: str, spec, version: int):
+    """
+    Pieces of about ``FAIL_FAST_CHUNK`` characters cut at delimiters of
+    add_vN (``version``), so that fail_fast can stop without splitting the
+    rest of the input. Bodies that cannot be cut are returned whole.
+    """
+    if spec is None:
+        separators = (",", "\n")
+    elif spec.shardable or (version < 7 and spec.disjoint):
+        separators = (spec.delimiter,)
+    else:
+        yield body
+        return
+    for start, end in _shard_bounds(body, separators, FAIL_FAST_CHUNK):
+        yield body[start:end]
+
+
+def _chunk_tokens(chunk: str, spec, version: int) -> list:
+    """Tokens of one piece of the body, split as add_vN (``version``) does."""
+    if spec is None:
+        return chunk.replace("\n", ",").split(",")
+    if version >= 7:
+        return spec.split(spec.clean(chunk))
+    return spec.split(chunk)
+
+
+def _scan_fail_fast(tokens, version: int) -> tuple:
+    """
+    Token by token part of ``_fail_fast``: ``(total, error)`` of ``tokens``,
+    stopping at the first error.
+    """
+    total = 0
+    for token in tokens:
+        if version == 6 and not token.strip():
+            continue
+        try:
+            n = int(token)
+        except ValueError as error:
+            if version < 7:
+                return total, str(error)
+            # v7 y v8 ignoran los tokens inválidos
+            continue
+        if n < 0 and version >= 6:
+            return total, _negatives_message(version, [n])
+        if version < 8 or n <= 1000:
+            total += n
+    return total, None
+
+
+def _fail_fast_chunk(chunk: str, spec, version: int) -> tuple:
+    """``(total, error)`` of one piece of the body for ``_fail_fast``."""
+    values = None
+    if spec is None and len(chunk) >= NUMPY_MIN_LENGTH:
+        values = _numpy_parse(chunk)
+    if values is not None:
+        # Todos los tokens son números simples: negativos y suma vectorizados
+        negatives = values[values < 0]
+        if version >= 6 and len(negatives):
+            return 0, _negatives_message(version, [int(negatives[0])])
+        return _numpy_total(values[values <= 1000] if version >= 8 else values), None
+
+    tokens = _chunk_tokens(chunk, spec, version)
+    try:
+        values = list(map(int, tokens))
+    except ValueError:
+        # Hay un token inválido: se busca token por token
+        return _scan_fail_fast(tokens, version)
+    if version >= 6 and min(values, default=0) < 0:
+        return _scan_fail_fast(tokens, version)
+    if version < 8:
+        return sum(values), None
+    return sum(filter((1000).__ge__, values)), None
+
+
+def _fail_fast(numbers: str, version: int) -> tuple:
+    """
+    add_v4..add_v8 (``version``) in a single pass that stops at the first
+    error: ``(total, error)``. The separator and mixed-delimiter checks run
+    before the numbers are read.
+    """
+    if numbers == "":
+        return 0, None
+    spec, body, error = _parse_header(numbers, version)
+    if error is not None:
+        return 0, error
+    if version >= 7 and spec is not None:
+        position = spec.find_mixed(body)
+        if position is not None:
+            return 0, (
+                f"'{spec.delimiter}' expected but ',' found at position {position}."
+            )
+
+    total = 0
+    for chunk in _body_chunks(body, spec, version):
+        chunk_total, error = _fail_fast_chunk(chunk, spec, version)
+        total += chunk_total
+        if error is not None:
+            return total, error
+    return total, None
+
+
+def _check_modes(numbers: str, version: int, fail_fast: bool, validate_only: bool):
+    """
+    Shared handling of ``fail_fast``/``validate_only`` for add_v4..add_v8.
+    Returns the error list in ``validate_only`` mode; in ``fail_fast`` mode
+    raises the first error or returns the sum computed in the same pass.
+    Returns None when the normal path should run.
+    """
+    if not (fail_fast or validate_only):
+        return None
+    if not fail_fast:
+        return _validation_errors(numbers, version)
+    total, error = _fail_fast(numbers, version)
+    if validate_only:
+        return [error] if error else []
+    if error is not None:
+        raise ValueError(error)
+    return total
+
+
+def add_v5(
+    numbers: str, fail_fast: bool = False, validate_only: bool = False
+) -> int | list:
+    """
+    Version 5 — Support custom delimiters.
+    ``fail_fast`` raises the first error found; ``validate_only`` returns the
+    list of errors without computing the sum.
+    """
+    result = _check_modes(numbers, 5, fail_fast, validate_only)
+    if result is not None:
+        return result
     if numbers == "":
         return 0
 
-    delimiter = ","
     body = numbers
 
     # Detect custom delimiter
     if numbers.startswith("//"):
         header, body = numbers.split("\n", 1)
-        delimiter = header[2:]
+        spec = DELIMITER_SPECS(header)
 
         # Validar que no termine con el delimitador custom
-        if body.endswith(delimiter):
+        if body.endswith(spec.delimiter):
             raise ValueError("Invalid input: separator at the end")
 
         # Para custom delimiter, solo usar ese delimitador
-        parts = body.split(delimiter)
+        parts = spec.split(body)
     else:
         # Para delimitadores por defecto (coma y newline)
         if body.endswith(",") or body.endswith("\n"):
@@ -69,22 +479,30 @@ def add_v5(numbers: str) -> int:
     return sum(map(int, parts))
 
 
-def add_v6(numbers: str) -> int:
-    """Version 6 — Raise error if negative numbers are present."""
+def add_v6(
+    numbers: str, fail_fast: bool = False, validate_only: bool = False
+) -> int | list:
+    """
+    Version 6 — Raise error if negative numbers are present.
+    ``fail_fast`` raises the first error found; ``validate_only`` returns the
+    list of errors without computing the sum.
+    """
+    result = _check_modes(numbers, 6, fail_fast, validate_only)
+    if result is not None:
+        return result
     if numbers == "":
         return 0
 
-    delimiter = ","
     body = numbers
 
     if numbers.startswith("//"):
         header, body = numbers.split("\n", 1)
-        delimiter = header[2:]
+        spec = DELIMITER_SPECS(header)
 
-        if body.endswith(delimiter):
+        if body.endswith(spec.delimiter):
             raise ValueError("Invalid input: separator at the end")
 
-        tokens = body.split(delimiter)
+        tokens = spec.split(body)
     else:
         if body.endswith(",") or body.endswith("\n"):
             raise ValueError("Invalid input: separator at the end")
@@ -101,57 +519,51 @@ def add_v6(numbers: str) -> int:
     return sum(nums)
 
 
-# pylint: disable=too-many-branches
-def add_v7(numbers: str) -> int:
+# pylint: disable=too-many-branches,too-many-locals
+def add_v7(
+    numbers: str, fail_fast: bool = False, validate_only: bool = False
+) -> int | list:
     """
     Version 7 — Aggregate multiple errors (negatives + mixed delimiters).
+    ``fail_fast`` raises the first error found; ``validate_only`` returns the
+    list of errors without computing the sum.
     """
+    result = _check_modes(numbers, 7, fail_fast, validate_only)
+    if result is not None:
+        return result
     if numbers == "":
         return 0
 
     delimiter = ","
     body = numbers
+    spec = None
 
     if numbers.startswith("//"):
         header, body = numbers.split("\n", 1)
-        delimiter = header[2:]
+        spec = DELIMITER_SPECS(header)
+        delimiter = spec.delimiter
 
     # Validar terminación con delimitador
     if body.endswith(delimiter) or (
-        not numbers.startswith("//") and (body.endswith(",") or body.endswith("\n"))
+        spec is None and (body.endswith(",") or body.endswith("\n"))
     ):
         raise ValueError("Invalid input: separator at the end")
 
     # Detectar delimitadores mezclados (solo si hay custom delimiter)
     mixed_error = None
-    if numbers.startswith("//"):
-        i = 0
-        while i < len(body):
-            ch = body[i]
-            # Si encontramos el inicio del delimitador custom, saltarlo completo
-            if body[i:].startswith(delimiter):
-                i += len(delimiter)
-                continue
-            # Si es dígito, signo negativo o newline (permitido), continuar
-            if ch.isdigit() or ch == "-" or ch == "\n":
-                i += 1
-                continue
-            # Si es coma y el delimitador no es coma, es un error
-            if ch == ",":
-                mixed_error = f"'{delimiter}' expected but ',' found at position {i}."
-                break
-            i += 1
-
-    # Para extraer números cuando hay delimitadores mezclados, usar regex o parseo manual
+    if spec is not None:
+        position = spec.find_mixed(body)
+        if position is not None:
+            mixed_error = (
+                f"'{delimiter}' expected but ',' found at position {position}."
+            )
+
     values = []
     negatives = []
 
-    # Construir una versión "limpia" reemplazando delimitadores incorrectos
-    clean_body = body
-    if numbers.startswith("//"):
+    if spec is not None:
         # Reemplazar comas por el delimitador correcto para poder parsear
-        clean_body = body.replace(",", delimiter)
-        tokens = clean_body.split(delimiter)
+        tokens = spec.split(spec.clean(body))
     else:
         tokens = body.replace("\n", ",").split(",")
 
@@ -182,7 +594,107 @@ def add_v7(numbers: str) -> int:
     return sum(values)
 
 
-def add_v8(numbers: str) -> int:
+def _scan_tokens(tokens) -> tuple:
+    """
+    Single pass over ``tokens``: parse, collect negatives and sum.
+    Returns ``(total, negatives)`` where ``total`` ignores numbers > 1000.
+    """
+    total = 0
+    negatives = []
+    for token in tokens:
+        try:
+            n = int(token)
+        except ValueError:
+            # Tokens vacíos o inválidos se ignoran, igual que antes
+            continue
+        if n < 0:
+            negatives.append(n)
+        elif n <= 1000:
+            total += n
+    return total, negatives
+
+
+def _error_message(negatives: list, delimiter: str, mixed_position):
+    """Aggregated add_v8 error message, or None when the input is valid."""
+    errors = []
+    if negatives:
+        errors.append(
+            f"Negative number(s) not allowed: {', '.join(map(str, negatives))}"
+        )
+    if mixed_position is not None:
+        errors.append(
+            f"'{delimiter}' expected but ',' found at position {mixed_position}."
+        )
+    return "\n".join(errors) if errors else None
+
+
+def _parse_v8_header(numbers: str) -> tuple:
+    """
+    Split a non-empty add_v8 input into ``(spec, body, error)``. ``spec`` is
+    None for the default delimiters; ``error`` is set when add_v8 would fail
+    before looking at the numbers.
+    """
+    spec = None
+    body = numbers
+    if numbers.startswith("//"):
+        header, newline, body = numbers.partition("\n")
+        if not newline:
+            return None, body, _MISSING_HEADER_NEWLINE
+        spec = DELIMITER_SPECS(header)
+
+    # Validar terminación con delimitador
+    if spec is not None:
+        if body.endswith(spec.delimiter):
+            return spec, body, _SEPARATOR_AT_END
+    elif body.endswith(",") or body.endswith("\n"):
+        return spec, body, _SEPARATOR_AT_END
+    return spec, body, None
+
+
+def _scan_body(body: str, spec) -> tuple:
+    """
+    Numbers part of add_v8 on a body that passed the header checks.
+    Returns ``(total, negatives, mixed_position)``.
+    """
+    if spec is not None:
+        # Detectar delimitadores mezclados en tiempo lineal
+        mixed_position = spec.find_mixed(body)
+        # Reemplazar comas por el delimitador correcto para poder parsear
+        total, negatives = _scan_tokens(spec.split(spec.clean(body)))
+        return total, negatives, mixed_position
+
+    values = None
+    if len(body) >= NUMPY_MIN_LENGTH:
+        values = _numpy_parse(body)
+    if values is not None:
+        # Chequeo de negativos y filtro > 1000 como operaciones de arreglo
+        negatives = values[values < 0].tolist()
+        total = int(values[(values >= 0) & (values <= 1000)].sum())
+    else:
+        total, negatives = _scan_tokens(body.replace("\n", ",").split(","))
+    return total, negatives, None
+
+
+def _evaluate_v8(numbers: str) -> tuple:
+    """
+    add_v8 rules without raising: returns ``(total, error)`` where ``error``
+    is the message add_v8 would raise, or None.
+    """
+    if numbers == "":
+        return 0, None
+
+    spec, body, error = _parse_v8_header(numbers)
+    if error is not None:
+        return 0, error
+
+    total, negatives, mixed_position = _scan_body(body, spec)
+    delimiter = "," if spec is None else spec.delimiter
+    return total, _error_message(negatives, delimiter, mixed_position)
+
+
+def add_v8(
+    numbers: str, fail_fast: bool = False, validate_only: bool = False
+) -> int | list:
     """
     Version 8 — Combine all features:
       - Custom delimiter
@@ -190,76 +702,456 @@ def add_v8(numbers: str) -> int:
       - Detect mixed delimiters
       - Detect negatives
       - Ignore numbers > 1000
+    ``fail_fast`` raises the first error found; ``validate_only`` returns the
+    list of errors without computing the sum.
     """
-    if numbers == "":
-        return 0
+    result = _check_modes(numbers, 8, fail_fast, validate_only)
+    if result is not None:
+        return result
+    total, error = _evaluate_v8(numbers)
+    if error is not None:
+        raise ValueError(error)
+    return total
 
-    delimiter = ","
-    body = numbers
 
-    if numbers.startswith("//"):
-        header, body = numbers.split("\n", 1)
-        delimiter = header[2:]
+def add_many(inputs) -> list:
+    """
+    Batch add_v8: one result per input, in order. Valid inputs give their
+    sum; invalid ones give the ValueError add_v8 would have raised, so a bad
+    item never stops the batch.
+    """
+    results = []
+    append = results.append
+    evaluate = _evaluate_v8
+    for numbers in inputs:
+        total, error = evaluate(numbers)
+        append(total if error is None else ValueError(error))
+    return results
 
-    # Validar terminación con delimitador
-    if body.endswith(delimiter) or (
-        not numbers.startswith("//") and (body.endswith(",") or body.endswith("\n"))
-    ):
-        raise ValueError("Invalid input: separator at the end")
 
-    # Detectar delimitadores mezclados (solo si hay custom delimiter)
-    mixed_error = None
-    if numbers.startswith("//"):
-        i = 0
-        while i < len(body):
-            ch = body[i]
-            if body[i:].startswith(delimiter):
-                i += len(delimiter)
-                continue
-            if ch.isdigit() or ch == "-" or ch == "\n":
-                i += 1
-                continue
-            if ch == ",":
-                mixed_error = f"'{delimiter}' expected but ',' found at position {i}."
-                break
-            i += 1
-
-    # Para extraer números cuando hay delimitadores mezclados, limpiar primero
-    values = []
+# pylint: disable=too-many-instance-attributes
+class StringCalculatorAccumulator:
+    """
+    Incremental add_v8: ``feed`` fragments as they arrive and ``close`` to get
+    the sum or the aggregated error. Only the header, the last partial token
+    and a short tail are buffered, so each fragment costs O(len(fragment)).
+    ``total``, ``negatives`` and ``mixed_position`` hold the running values
+    for the completed tokens. The object pickles, so a consumer can
+    checkpoint it and resume later.
+    """
+
+    def __init__(self):
+        """Start with nothing read."""
+        self._prefix = ""  # Texto leído antes de conocer el encabezado
+        self._custom = None
+        self.delimiter = ","
+        self._carry = ""  # Último token, posiblemente incompleto
+        self._tail = ""  # Últimos caracteres del cuerpo
+        self._pending = ""  # Texto aún sin revisar por delimitadores mezclados
+        self._pending_offset = 0
+        self.total = 0
+        self.negatives = []
+        self.mixed_position = None
+
+    def feed(self, text: str) -> None:
+        """Consume the next fragment of input."""
+        if self._custom is None:
+            self._prefix += text
+            if len(self._prefix) < 2:
+                return
+            if not self._prefix.startswith("//"):
+                self._custom = False
+                text = self._prefix
+            else:
+                newline = self._prefix.find("\n")
+                if newline < 0:
+                    return
+                self._custom = True
+                self.delimiter = self._prefix[2:newline]
+                text = self._prefix[newline + 1 :]
+            self._prefix = ""
+        if text:
+            self._feed_body(text)
+
+    def _feed_body(self, text: str) -> None:
+        """Consume a piece of the body (after the header)."""
+        delimiter = self.delimiter
+        if delimiter == "":
+            # Siempre termina en "separator at the end"; no hay nada que sumar
+            return
+
+        keep = len(delimiter)
+        if len(text) >= keep:
+            self._tail = text[-keep:]
+        else:
+            self._tail = (self._tail + text)[-keep:]
+
+        if self._custom:
+            if self.mixed_position is None:
+                buffer = self._pending + text
+                position, resume = _first_stray_comma(buffer, delimiter, False)
+                if position is not None:
+                    self.mixed_position = self._pending_offset + position
+                    self._pending = ""
+                else:
+                    self._pending = buffer[resume:]
+                    self._pending_offset += resume
+            if delimiter != ",":
+                text = text.replace(",", delimiter)
+        else:
+            text = text.replace("\n", ",")
+
+        tokens = (self._carry + text).split(delimiter)
+        self._carry = tokens.pop()
+        total, negatives = _scan_tokens(tokens)
+        self.total += total
+        self.negatives.extend(negatives)
+
+    def close(self) -> int:
+        """Finish the input: return the add_v8 sum or raise its ValueError."""
+        if self._custom is None:
+            if self._prefix == "":
+                return 0
+            if self._prefix.startswith("//"):
+                raise ValueError(_MISSING_HEADER_NEWLINE)
+            self._custom = False
+            self._feed_body(self._prefix)
+            self._prefix = ""
+
+        if self._tail.endswith(self.delimiter) or (
+            not self._custom and self._tail.endswith("\n")
+        ):
+            raise ValueError(_SEPARATOR_AT_END)
+
+        if self._custom and self.mixed_position is None:
+            position, _ = _first_stray_comma(self._pending, self.delimiter)
+            if position is not None:
+                self.mixed_position = self._pending_offset + position
+
+        total, negatives = _scan_tokens((self._carry,))
+        error = _error_message(
+            self.negatives + negatives, self.delimiter, self.mixed_position
+        )
+        if error is not None:
+            raise ValueError(error)
+        return self.total + total
+
+
+def _read_chunks(reader, chunk_size: int):
+    """Yield ``reader.read(chunk_size)`` until the reader is exhausted."""
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_chunks(source, chunk_size: int):
+    """Yield text chunks from a str, a reader with ``read`` or an iterable."""
+    if isinstance(source, (str, bytes)):
+        chunks = (source,)
+    elif hasattr(source, "read"):
+        chunks = _read_chunks(source, chunk_size)
+    else:
+        chunks = source
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    rest = decoder.decode(b"", final=True)
+    if rest:
+        yield rest
+
+
+def add_v8_stream(source, chunk_size: int = 65536) -> int:
+    """
+    Streaming add_v8 over a text/binary file, a reader such as
+    ``socket.makefile()`` or an iterable of ``str``/``bytes`` chunks.
+    Memory stays flat: only the header and the current token are buffered.
+    """
+    accumulator = StringCalculatorAccumulator()
+    for chunk in _iter_chunks(source, chunk_size):
+        accumulator.feed(chunk)
+    return accumulator.close()
+
+
+def _scan_shard(shard: str, header) -> tuple:
+    """Worker entry point: ``_scan_body`` on one shard of a larger body."""
+    spec = None if header is None else DELIMITER_SPECS(header)
+    return _scan_body(shard, spec)
+
+
+def _shard_bounds(body: str, separators: tuple, shard_size: int) -> list:
+    """
+    ``(start, end)`` pairs cutting ``body`` right before a separator roughly
+    every ``shard_size`` characters; the separator itself is dropped.
+    """
+    bounds = []
+    start = 0
+    while len(body) - start > shard_size:
+        cut, width = -1, 0
+        for separator in separators:
+            position = body.find(separator, start + shard_size)
+            if position >= 0 and (cut < 0 or position < cut):
+                cut, width = position, len(separator)
+        if cut < 0:
+            break
+        bounds.append((start, cut))
+        start = cut + width
+    bounds.append((start, len(body)))
+    return bounds
+
+
+def _merge_shards(bounds: list, results: list) -> tuple:
+    """Merge per-shard ``_scan_body`` results in input order."""
+    total = 0
     negatives = []
+    mixed_position = None
+    for (start, _), (shard_total, shard_negatives, shard_mixed) in zip(bounds, results):
+        total += shard_total
+        negatives.extend(shard_negatives)
+        if mixed_position is None and shard_mixed is not None:
+            # Posición local del shard -> posición global en el cuerpo
+            mixed_position = start + shard_mixed
+    return total, negatives, mixed_position
 
-    clean_body = body
-    if numbers.startswith("//"):
-        # Reemplazar comas por el delimitador correcto para poder parsear
-        clean_body = body.replace(",", delimiter)
-        tokens = clean_body.split(delimiter)
+
+# pylint: disable=too-many-locals
+def add_v8_parallel(
+    numbers: str, workers=None, shard_size: int = 1 << 20, executor=None
+) -> int:
+    """
+    add_v8 for very large inputs: the body is cut at delimiter boundaries into
+    shards of about ``shard_size`` characters that are summed on a process
+    pool (``executor``, or a new one with ``workers`` processes). Partial
+    sums, negatives and mixed-delimiter positions are merged in input order,
+    so results and error messages are identical to add_v8.
+    """
+    if numbers == "":
+        return 0
+
+    spec, body, error = _parse_v8_header(numbers)
+    if error is not None:
+        raise ValueError(error)
+
+    delimiter = "," if spec is None else spec.delimiter
+    bounds = [(0, len(body))]
+    if spec is None:
+        bounds = _shard_bounds(body, (",", "\n"), shard_size)
+    elif spec.shardable:
+        bounds = _shard_bounds(body, (delimiter,), shard_size)
+
+    if len(bounds) == 1:
+        total, negatives, mixed_position = _scan_body(body, spec)
     else:
-        tokens = body.replace("\n", ",").split(",")
+        shards = [body[start:end] for start, end in bounds]
+        header = None if spec is None else "//" + delimiter
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(_scan_shard, shards, itertools.repeat(header))
+                total, negatives, mixed_position = _merge_shards(bounds, results)
+        else:
+            results = executor.map(_scan_shard, shards, itertools.repeat(header))
+            total, negatives, mixed_position = _merge_shards(bounds, results)
 
-    for t in tokens:
-        if not t.strip():
-            continue
-        try:
-            n = int(t)
-            if n < 0:
-                negatives.append(n)
-            # Solo agregar si es <= 1000
-            if n <= 1000:
-                values.append(n)
-        except ValueError:
-            # Si hay error al parsear, ignorar (ya detectamos el error de delimitador)
-            pass
+    error = _error_message(negatives, delimiter, mixed_position)
+    if error is not None:
+        raise ValueError(error)
+    return total
 
-    # Recolectar errores
+
+# pylint: disable=too-few-public-methods
+class DelimiterAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of delimiters. ``separators``
+    finds the leftmost-longest, non-overlapping matches in one left-to-right
+    pass, so the cost is linear in the text whatever the number of patterns.
+    """
+
+    __slots__ = ("_delta", "_output", "_reach")
+
+    def __init__(self, patterns):
+        """Build the automaton for non-empty ``patterns``."""
+        goto = [{}]
+        output = [()]
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                child = goto[state].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[state][char] = child
+                    goto.append({})
+                    output.append(())
+                state = child
+            output[state] = (len(pattern),)
+
+        # Enlaces de fallo en anchura; las transiciones se completan para que
+        # cada carácter cueste una sola consulta
+        delta = [dict(edges) for edges in goto]
+        fail = [0] * len(goto)
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            link = fail[state]
+            output[state] += output[link]
+            for char, target in delta[link].items():
+                delta[state].setdefault(char, target)
+            for char, child in goto[state].items():
+                fail[child] = delta[link].get(char, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._output = output
+        self._reach = max(map(len, patterns)) - 1
+
+    def separators(self, text: str):
+        """Yield ``(start, end)`` of each selected match, in order."""
+        delta = self._delta
+        output = self._output
+        reach = self._reach
+        # Longitud de la coincidencia más larga encontrada por posición inicial
+        best = {}
+        cursor = 0
+        state = 0
+        # Los None del final vacían las coincidencias aún pendientes
+        for index, char in enumerate(itertools.chain(text, [None] * reach)):
+            state = delta[state].get(char, 0)
+            for length in output[state]:
+                start = index - length + 1
+                if start >= cursor and best.get(start, 0) < length:
+                    best[start] = length
+            # Ya no puede aparecer otra coincidencia que empiece antes de limit
+            limit = index - reach
+            while cursor <= limit:
+                length = best.pop(cursor, 0)
+                if length:
+                    yield cursor, cursor + length
+                    for covered in range(cursor + 1, cursor + length):
+                        best.pop(covered, None)
+                    cursor += length
+                elif best:
+                    cursor += 1
+                else:
+                    cursor = limit + 1
+
+
+_BRACKETED_HEADER = re.compile(r"//(?:\[[^\]]+\])+")
+_BRACKETED_DELIMITER = re.compile(r"\[([^\]]+)\]")
+
+
+class MultiDelimiterSpec:
+    """
+    Parsing logic for one add_v9 header: ``//[d1][d2]...`` declares several
+    delimiters of any length, any other ``//<delim>`` a single one as in
+    add_v8. Built once and reused through ``MULTI_DELIMITER_SPECS``.
+    """
+
+    __slots__ = ("delimiters", "comma_is_delimiter", "_automaton")
+
+    def __init__(self, header: str):
+        """Compile the spec for ``header`` (the text before the first newline)."""
+        if _BRACKETED_HEADER.fullmatch(header):
+            delimiters = _BRACKETED_DELIMITER.findall(header)
+        else:
+            delimiters = [header[2:]]
+        self.delimiters = tuple(dict.fromkeys(delimiters))
+        self.comma_is_delimiter = "," in self.delimiters
+
+        # Un solo delimitador sin comas se resuelve con str.split
+        self._automaton = None
+        first = self.delimiters[0]
+        if len(self.delimiters) > 1 or ("," in first and first != ","):
+            patterns = self.delimiters
+            if not self.comma_is_delimiter:
+                # Las comas sueltas también separan, pero se reportan
+                patterns += (",",)
+            self._automaton = DelimiterAutomaton(patterns)
+
+    def ends_with_delimiter(self, body: str) -> bool:
+        """Whether ``body`` ends with one of the delimiters."""
+        return body.endswith(self.delimiters)
+
+    def scan(self, body: str) -> tuple:
+        """
+        Split ``body`` on the delimiters and on stray commas. Returns
+        ``(tokens, stray_positions)`` with every ',' that is not part of a
+        delimiter.
+        """
+        if self._automaton is None:
+            delimiter = self.delimiters[0]
+            if delimiter == ",":
+                return body.split(","), []
+            stray = []
+            comma = body.find(",")
+            while comma >= 0:
+                stray.append(comma)
+                comma = body.find(",", comma + 1)
+            if not stray:
+                return body.split(delimiter), stray
+            return [
+                token for piece in body.split(",") for token in piece.split(delimiter)
+            ], stray
+
+        tokens = []
+        stray = []
+        previous = 0
+        check_commas = not self.comma_is_delimiter
+        for start, end in self._automaton.separators(body):
+            tokens.append(body[previous:start])
+            if check_commas and end - start == 1 and body[start] == ",":
+                stray.append(start)
+            previous = end
+        tokens.append(body[previous:])
+        return tokens, stray
+
+
+MULTI_DELIMITER_SPECS = DelimiterSpecCache(factory=MultiDelimiterSpec)
+
+
+def _mixed_message(delimiters: tuple, positions: list) -> str:
+    """add_v9 mixed-delimiter error listing every stray ',' position."""
+    expected = " or ".join(f"'{delimiter}'" for delimiter in delimiters)
+    where = "position" if len(positions) == 1 else "positions"
+    return (
+        f"{expected} expected but ',' found at {where} "
+        f"{', '.join(map(str, positions))}."
+    )
+
+
+def add_v9(numbers: str) -> int:
+    """
+    Version 9 — Multiple delimiters of any length:
+      - ``//[***][%%]\\n`` declares several bracketed delimiters
+      - ``//<delim>\\n`` keeps the single delimiter of add_v8
+      - Mixed-delimiter errors list every stray ',' position
+      - Negatives and numbers > 1000 as in add_v8
+    """
+    if not numbers.startswith("//"):
+        total, error = _evaluate_v8(numbers)
+        if error is not None:
+            raise ValueError(error)
+        return total
+
+    header, newline, body = numbers.partition("\n")
+    if not newline:
+        raise ValueError(_MISSING_HEADER_NEWLINE)
+    spec = MULTI_DELIMITER_SPECS(header)
+    if spec.ends_with_delimiter(body):
+        raise ValueError(_SEPARATOR_AT_END)
+
+    tokens, stray = spec.scan(body)
+    total, negatives = _scan_tokens(tokens)
     errors = []
     if negatives:
         errors.append(
             f"Negative number(s) not allowed: {', '.join(map(str, negatives))}"
         )
-    if mixed_error:
-        errors.append(mixed_error)
-
+    if stray:
+        errors.append(_mixed_message(spec.delimiters, stray))
     if errors:
         raise ValueError("\n".join(errors))
-
-    return sum(values)
+    return total
@@ -4,73 +4,372 @@ Password Validator - Incremental versions (TDD)
 Each version accumulates previous validation rules.
 """
 
-import re
+import collections
+import itertools
+import string
+
+from tddmanifiesto.pooling import ordered_submit, pool_window, process_pool
+from white_box.class_exercises import validate_password
+
+# Special characters accepted by validate_password_v5
+SPECIAL_CHARACTERS = '!@#$%^&*(),.?":{}|<>'
+
+# Counts spelled out in the error messages
+_COUNT_WORDS = {1: "un", 2: "dos", 3: "tres", 4: "cuatro", 5: "cinco"}
+
+
+def _class_table(special: str) -> dict:
+    """Translate table of ASCII classes: d(igit), u(pper), s(pecial)."""
+    table = dict.fromkeys(range(128))
+    for ch in string.digits:
+        table[ord(ch)] = "d"
+    for ch in string.ascii_uppercase:
+        table[ord(ch)] = "u"
+    for ch in special:
+        if ch.isascii():
+            table[ord(ch)] = (table[ord(ch)] or "") + "s"
+    return table
+
+
+def _classifier(special: str):
+    """One-pass ``password -> (digits, has_upper, has_special)``."""
+    table = _class_table(special)
+
+    def classify(password: str) -> tuple:
+        if password.isascii():
+            classes = password.translate(table)
+            return classes.count("d"), "u" in classes, "s" in classes
+
+        # Outside ASCII, use Unicode isdigit and isupper
+        digits = 0
+        has_upper = False
+        has_special = False
+        for ch in password:
+            if ch.isdigit():
+                digits += 1
+            elif ch.isupper():
+                has_upper = True
+            if ch in special:
+                has_special = True
+        return digits, has_upper, has_special
+
+    return classify
+
+
+_DROP_ASCII_DIGITS = str.maketrans("", "", string.digits)
+
+
+def _has_upper(password: str) -> bool:
+    """Whether there is an uppercase letter."""
+    if password.isascii():
+        return password != password.lower()
+    return any(map(str.isupper, password))
+
+
+def _count_digits(password: str) -> int:
+    """Number of characters for which str.isdigit is true."""
+    if password.isascii():
+        return len(password) - len(password.translate(_DROP_ASCII_DIGITS))
+    return sum(map(str.isdigit, password))
+
+
+class PasswordPolicy:
+    """Declarative password rules, compiled into a validate_password_vN function."""
+
+    MODES = ("collect_all", "first_failure")
+
+    def __init__(self, min_length=0, min_digits=0, uppercase=False, special=None):
+        """Rules left at their default are not checked."""
+        self.min_length = min_length
+        self.min_digits = min_digits
+        self.uppercase = uppercase
+        self.special = special
+
+    def messages(self) -> dict:
+        """Error message of each active rule, in reporting order."""
+        messages = {}
+        if self.min_length:
+            messages["min_length"] = (
+                f"La contraseña debe tener al menos {self.min_length} caracteres"
+            )
+        if self.min_digits:
+            count = _COUNT_WORDS.get(self.min_digits, str(self.min_digits))
+            plural = "s" if self.min_digits > 1 else ""
+            messages["min_digits"] = (
+                f"La contraseña debe contener al menos {count} número{plural}"
+            )
+        if self.uppercase:
+            messages["uppercase"] = (
+                "La contraseña debe contener al menos una letra mayúscula"
+            )
+        if self.special is not None:
+            messages["special"] = (
+                "La contraseña debe contener al menos un carácter especial"
+            )
+        return messages
+
+    def compile(self, mode="collect_all"):
+        """Validator reporting every error (collect_all) or the first (first_failure)."""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        if mode == "first_failure":
+            return self._compile_first_failure()
+        return self._compile_collect_all()
+
+    def _compile_collect_all(self):
+        """Validator collecting every error in one pass."""
+        messages = self.messages()
+        min_length = self.min_length
+        min_digits = self.min_digits
+        length_error = messages.get("min_length")
+        digits_error = messages.get("min_digits")
+        upper_error = messages.get("uppercase")
+        special_error = messages.get("special")
+        scan = digits_error or upper_error or special_error
+        classify = _classifier(self.special or "")
+
+        def validate(password: str) -> dict:
+            errors = []
+            if len(password) < min_length:
+                errors.append(length_error)
+            if scan:
+                digits, has_upper, has_special = classify(password)
+                if digits < min_digits:
+                    errors.append(digits_error)
+                if upper_error and not has_upper:
+                    errors.append(upper_error)
+                if special_error and not has_special:
+                    errors.append(special_error)
+            return {"is_valid": len(errors) == 0, "errors": errors}
+
+        return validate
+
+    def _compile_first_failure(self):
+        """Validator stopping at the first failing rule."""
+        messages = self.messages()
+        checks = []
+        # Cheapest first: length, early-exit searches, then the digit count
+        if "min_length" in messages:
+            min_length = self.min_length
+            checks.append((lambda p: len(p) >= min_length, messages["min_length"]))
+        if "special" in messages:
+            special = frozenset(self.special)
+            checks.append((lambda p: not special.isdisjoint(p), messages["special"]))
+        if "uppercase" in messages:
+            checks.append((_has_upper, messages["uppercase"]))
+        if "min_digits" in messages:
+            min_digits = self.min_digits
+            checks.append(
+                (lambda p: _count_digits(p) >= min_digits, messages["min_digits"])
+            )
+        checks = tuple(checks)
+
+        def validate(password: str) -> dict:
+            for check, message in checks:
+                if not check(password):
+                    return {"is_valid": False, "errors": [message]}
+            return {"is_valid": True, "errors": []}
+
+        return validate
+
+
+# The kata versions as data: each one adds a rule to the previous one
+PASSWORD_POLICIES = {
+    1: PasswordPolicy(min_length=8),
+    2: PasswordPolicy(min_length=8, min_digits=2),
+    3: PasswordPolicy(min_length=8, min_digits=2),
+    4: PasswordPolicy(min_length=8, min_digits=2, uppercase=True),
+    5: PasswordPolicy(
+        min_length=8, min_digits=2, uppercase=True, special=SPECIAL_CHARACTERS
+    ),
+}
+_VALIDATORS = {
+    version: policy.compile() for version, policy in PASSWORD_POLICIES.items()
+}
 
 
 def validate_password_v1(password: str) -> dict:
     """Version 1 — At least 8 characters."""
-    errors = []
-    if len(password) < 8:
-        errors.append("La contraseña debe tener al menos 8 caracteres")
-    return {"is_valid": len(errors) == 0, "errors": errors}
+    return _VALIDATORS[1](password)
 
 
 def validate_password_v2(password: str) -> dict:
     """Version 2 — Also must contain at least two numbers."""
-    errors = []
-    if len(password) < 8:
-        errors.append("La contraseña debe tener al menos 8 caracteres")
-
-    digits = sum(ch.isdigit() for ch in password)
-    if digits < 2:
-        errors.append("La contraseña debe contener al menos dos números")
-
-    return {"is_valid": len(errors) == 0, "errors": errors}
+    return _VALIDATORS[2](password)
 
 
 def validate_password_v3(password: str) -> dict:
     """Version 3 — Multiple errors handled together."""
-    errors = []
-    if len(password) < 8:
-        errors.append("La contraseña debe tener al menos 8 caracteres")
-
-    digits = sum(ch.isdigit() for ch in password)
-    if digits < 2:
-        errors.append("La contraseña debe contener al menos dos números")
-
-    return {"is_valid": len(errors) == 0, "errors": errors}
+    return _VALIDATORS[3](password)
 
 
 def validate_password_v4(password: str) -> dict:
     """Version 4 — Must contain at least one uppercase letter."""
-    errors = []
-    if len(password) < 8:
-        errors.append("La contraseña debe tener al menos 8 caracteres")
+    return _VALIDATORS[4](password)
 
-    digits = sum(ch.isdigit() for ch in password)
-    if digits < 2:
-        errors.append("La contraseña debe contener al menos dos números")
 
-    if not any(ch.isupper() for ch in password):
-        errors.append("La contraseña debe contener al menos una letra mayúscula")
+def validate_password_v5(password: str) -> dict:
+    """Version 5 — Must contain at least one special character."""
+    return _VALIDATORS[5](password)
 
-    return {"is_valid": len(errors) == 0, "errors": errors}
 
+# Bits of the validate_passwords records: one per validate_password_v5
+# error, plus the white_box verdict
+TOO_SHORT = 1
+FEW_DIGITS = 2
+NO_UPPERCASE = 4
+NO_SPECIAL = 8
+WHITE_BOX_INVALID = 16
+V5_ERRORS = TOO_SHORT | FEW_DIGITS | NO_UPPERCASE | NO_SPECIAL
 
-def validate_password_v5(password: str) -> dict:
-    """Version 5 — Must contain at least one special character."""
-    errors = []
-    if len(password) < 8:
-        errors.append("La contraseña debe tener al menos 8 caracteres")
+# Policy rule behind each error bit, in validate_password_v5 order
+_RULE_BITS = (
+    ("min_length", TOO_SHORT),
+    ("min_digits", FEW_DIGITS),
+    ("uppercase", NO_UPPERCASE),
+    ("special", NO_SPECIAL),
+)
+_CODE_NAMES = (
+    ("too_short", TOO_SHORT),
+    ("few_digits", FEW_DIGITS),
+    ("no_uppercase", NO_UPPERCASE),
+    ("no_special", NO_SPECIAL),
+    ("white_box_invalid", WHITE_BOX_INVALID),
+)
+
+# Length and ASCII special characters of white_box's validate_password
+_WHITE_BOX_MIN_LENGTH = 8
+_WHITE_BOX_SPECIALS = "".join(
+    ch
+    for ch in map(chr, range(128))
+    if not ch.isalnum()
+    and validate_password(("Aa1" + ch).ljust(_WHITE_BOX_MIN_LENGTH, "a"))
+)
+
+
+def _compile_code(policy: PasswordPolicy):
+    """``password -> record`` with the error bits of ``policy`` and white_box."""
+    min_length = policy.min_length
+    min_digits = policy.min_digits
+    uppercase = policy.uppercase
+    special = policy.special
+    classify = _classifier(special or "")
+    # Policy classes plus l(ower) and w(hite_box special); a character can be both
+    table = _class_table(special or "")
+    for ch in string.ascii_lowercase:
+        table[ord(ch)] = "l"
+    for ch in _WHITE_BOX_SPECIALS:
+        table[ord(ch)] = (table[ord(ch)] or "") + "w"
+
+    def code(password: str) -> int:
+        record = TOO_SHORT if len(password) < min_length else 0
+        if password.isascii():
+            classes = password.translate(table)
+            digits = classes.count("d")
+            has_upper = "u" in classes
+            has_special = "s" in classes
+            white_box_valid = (
+                len(password) >= _WHITE_BOX_MIN_LENGTH
+                and has_upper
+                and digits
+                and "l" in classes
+                and "w" in classes
+            )
+        else:
+            digits, has_upper, has_special = classify(password)
+            white_box_valid = validate_password(password)
+
+        if digits < min_digits:
+            record |= FEW_DIGITS
+        if uppercase and not has_upper:
+            record |= NO_UPPERCASE
+        if special is not None and not has_special:
+            record |= NO_SPECIAL
+        if not white_box_valid:
+            record |= WHITE_BOX_INVALID
+        return record
+
+    return code
+
+
+_password_code = _compile_code(PASSWORD_POLICIES[5])
+_V5_MESSAGES = PASSWORD_POLICIES[5].messages()
+_CODE_MESSAGES = tuple(
+    (bit, _V5_MESSAGES[rule]) for rule, bit in _RULE_BITS if rule in _V5_MESSAGES
+)
+
+
+def password_code(password: str) -> int:
+    """validate_password_v5 error bits of ``password``, plus WHITE_BOX_INVALID."""
+    return _password_code(password)
+
+
+def password_errors(code: int) -> list:
+    """validate_password_v5 error list of a ``password_code`` record."""
+    return [message for bit, message in _CODE_MESSAGES if code & bit]
+
+
+def _code_batch(batch: list) -> bytes:
+    """Records of a batch, one byte per password."""
+    return bytes(map(_password_code, batch))
+
+
+def _count_batch(batch: list) -> collections.Counter:
+    """Count of each record in a batch."""
+    return collections.Counter(map(_password_code, batch))
+
+
+def _batches(passwords, batch_size: int):
+    """Tasks of ``batch_size`` passwords for ``ordered_submit``."""
+    iterator = iter(passwords)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield (batch,)
+
+
+def _summary(counts: collections.Counter) -> dict:
+    """Totals per rule from the record counts."""
+    summary = {
+        "total": sum(counts.values()),
+        "v5_valid": sum(n for code, n in counts.items() if not code & V5_ERRORS),
+        "white_box_valid": sum(
+            n for code, n in counts.items() if not code & WHITE_BOX_INVALID
+        ),
+    }
+    for name, bit in _CODE_NAMES:
+        summary[name] = sum(n for code, n in counts.items() if code & bit)
+    return summary
+
+
+def _pooled(function, passwords, workers, batch_size, executor):
+    """Results of ``function`` over batches run on the pool, in input order."""
+    with process_pool(workers, executor) as pool:
+        yield from ordered_submit(
+            pool, function, _batches(passwords, batch_size), pool_window(workers)
+        )
 
-    digits = sum(ch.isdigit() for ch in password)
-    if digits < 2:
-        errors.append("La contraseña debe contener al menos dos números")
 
-    if not any(ch.isupper() for ch in password):
-        errors.append("La contraseña debe contener al menos una letra mayúscula")
+# pylint: disable=too-many-arguments
+def validate_passwords(
+    passwords, workers=None, batch_size=10000, counts_only=False, executor=None
+):
+    """
+    Bulk validate_password_v5 and white_box check: ``password_code`` records
+    in input order, or totals per rule with ``counts_only``. Batches run on
+    a process pool when ``workers`` or ``executor`` is given.
+    """
+    if workers is None and executor is None:
+        if counts_only:
+            return _summary(_count_batch(passwords))
+        return map(_password_code, passwords)
 
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
-        errors.append("La contraseña debe contener al menos un carácter especial")
+    if not counts_only:
+        records = _pooled(_code_batch, passwords, workers, batch_size, executor)
+        return itertools.chain.from_iterable(records)
 
-    return {"is_valid": len(errors) == 0, "errors": errors}
+    counts = collections.Counter()
+    for batch_counts in _pooled(_count_batch, passwords, workers, batch_size, executor):
+        counts.update(batch_counts)
+    return _summary(counts)
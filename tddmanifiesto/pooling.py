@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Process pool helpers shared by the katas that spread work over processes.
+"""
+
+import collections
+import contextlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def pool_window(workers=None) -> int:
+    """Tasks kept in flight for a pool of ``workers``: two per worker."""
+    return 2 * (workers or os.cpu_count() or 1)
+
+
+def process_pool(workers=None, executor=None):
+    """The given ``executor`` (left open on exit) or a new pool of ``workers``."""
+    if executor is not None:
+        return contextlib.nullcontext(executor)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def ordered_submit(executor, function, tasks, window: int):
+    """
+    Submit ``function(*task)`` for each of ``tasks`` with at most ``window``
+    pending and yield the results in task order, so memory does not grow
+    with the number of tasks.
+    """
+    pending = collections.deque()
+    for task in tasks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, *task))
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the helpers shared by the benchmark harnesses.
+Tests are named following the Given-When-Then convention (TDD Manifesto).
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from tddmanifiesto.bench_common import (
+    compare_files,
+    compare_results,
+    make_report,
+    write_report,
+)
+
+
+class TestCompareResults(unittest.TestCase):
+    """
+    Comparing two reports flags slower or hungrier measurements.
+    """
+
+    SHAPE = {"tokens": 10}
+
+    def report(self, seconds, peak_bytes):
+        """Single-measurement report."""
+        return {
+            "results": [
+                {
+                    "function": "add_v8",
+                    "shape": self.SHAPE,
+                    "seconds": seconds,
+                    "peak_bytes": peak_bytes,
+                }
+            ]
+        }
+
+    def test_given_slower_run_when_compared_then_flags_regression(self):
+        """Should flag a time ratio above ``1 + threshold``."""
+        rows = compare_results(self.report(1.0, 100), self.report(1.5, 100), 0.1)
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0]["regression"])
+        self.assertAlmostEqual(rows[0]["time_ratio"], 1.5)
+
+    def test_given_similar_run_when_compared_then_reports_no_regression(self):
+        """Should accept changes within the threshold."""
+        rows = compare_results(self.report(1.0, 100), self.report(1.05, 105), 0.1)
+        self.assertFalse(rows[0]["regression"])
+
+
+class TestReportFiles(unittest.TestCase):
+    """
+    Reports written to disk can be compared from their paths.
+    """
+
+    def test_given_two_report_files_when_compared_then_returns_exit_status(self):
+        """Should print one line per pair and return 1 only on a regression."""
+        result = {"function": "f", "shape": {"n": 1}, "seconds": 1.0, "peak_bytes": 8}
+        slower = dict(result, seconds=2.0)
+        with tempfile.TemporaryDirectory() as directory:
+            old = os.path.join(directory, "old.json")
+            new = os.path.join(directory, "new.json")
+            write_report(make_report([result], repeat=1), old)
+            write_report(make_report([slower], repeat=1), new)
+            printed = io.StringIO()
+            with contextlib.redirect_stdout(printed):
+                self.assertEqual(compare_files(old, old), 0)
+                self.assertEqual(compare_files(old, new), 1)
+        self.assertEqual(printed.getvalue().count("REGRESSION"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the FizzBuzz differential benchmark.
+Tests are named following the Given-When-Then convention (TDD Manifesto).
+"""
+
+import contextlib
+import io
+import json
+import unittest
+from unittest import mock
+
+from tddmanifiesto import bench_fizzbuzz
+from tddmanifiesto.bench_fizzbuzz import check_equivalence, main, measure
+
+
+class TestCheckEquivalence(unittest.TestCase):
+    """
+    Every implementation agrees with fizz_buzz inside its domain.
+    """
+
+    def test_given_repo_functions_when_checked_then_reports_no_mismatches(self):
+        """Partial iterations are only compared where their spec applies."""
+        self.assertEqual(check_equivalence(-50, 500), [])
+
+    def test_given_broken_function_when_checked_then_reports_the_numbers(self):
+        """A function that disagrees is reported with the offending n."""
+        functions = dict(bench_fizzbuzz.NUMBER_FUNCTIONS, broken=str)
+        with mock.patch.object(bench_fizzbuzz, "NUMBER_FUNCTIONS", functions):
+            mismatches = check_equivalence(1, 7)
+        self.assertEqual(
+            mismatches,
+            [
+                ("broken", 3, "Fizz", "3"),
+                ("broken", 5, "Buzz", "5"),
+                ("broken", 6, "Fizz", "6"),
+            ],
+        )
+
+
+class TestMeasure(unittest.TestCase):
+    """
+    Measurements include time and memory per call.
+    """
+
+    def test_given_number_function_when_measured_then_reports_per_call_figures(self):
+        """Should report ns, retained blocks and peak bytes per call for the shape."""
+        result = measure("fizz_buzz", 1, 300, repeat=1)
+        self.assertEqual(result["shape"], {"start": 1, "count": 300})
+        self.assertGreater(result["ns_per_call"], 0)
+        self.assertGreater(result["retained_blocks_per_call"], 0)
+        self.assertGreater(result["peak_bytes"], 0)
+
+    def test_given_range_function_when_measured_then_peak_grows_with_the_range(self):
+        """The peak is taken around the call, so a longer range needs more bytes."""
+        small = measure("fizz_buzz_range", 1, 1000, repeat=1)
+        large = measure("fizz_buzz_range", 1, 100000, repeat=1)
+        self.assertGreater(large["peak_bytes"], small["peak_bytes"])
+
+
+class TestCommandLine(unittest.TestCase):
+    """
+    The ``check`` and ``run`` subcommands work end to end.
+    """
+
+    def test_given_clean_range_when_check_called_then_exits_with_zero(self):
+        """Should report no mismatches and exit with 0."""
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed):
+            self.assertEqual(main(["check", "--start", "1", "--stop", "200"]), 0)
+        self.assertIn("0 mismatches", printed.getvalue())
+
+    def test_given_no_output_when_run_called_then_prints_the_report(self):
+        """Should print one measurement per function and shape as JSON."""
+        printed = io.StringIO()
+        arguments = ["run", "--starts", "1", "--counts", "50", "--repeat", "1"]
+        functions = ["--functions", "fizz_buzz", "fizz_buzz_range"]
+        with contextlib.redirect_stdout(printed):
+            self.assertEqual(main(arguments + functions), 0)
+        results = json.loads(printed.getvalue())["results"]
+        self.assertEqual(
+            [result["function"] for result in results],
+            ["fizz_buzz", "fizz_buzz_range"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the String Calculator benchmark harness.
+Tests are named following the Given-When-Then convention (TDD Manifesto).
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from tddmanifiesto.bench_stringcalculator import main, make_input, supports
+from tddmanifiesto.class_stringcalculator import add_v8
+
+
+class TestMakeInput(unittest.TestCase):
+    """
+    Generated inputs follow the requested shape.
+    """
+
+    def test_given_default_delimiter_when_make_input_called_then_has_requested_tokens(
+        self,
+    ):
+        """Should produce ``tokens`` numbers of ``width`` digits separated by commas."""
+        numbers = make_input(tokens=50, width=3)
+        tokens = numbers.split(",")
+        self.assertEqual(len(tokens), 50)
+        self.assertTrue(all(len(token) == 3 for token in tokens))
+
+    def test_given_mixed_position_when_make_input_called_then_add_v8_reports_the_comma(
+        self,
+    ):
+        """Should add a ``//`` header and swap one delimiter for a comma."""
+        numbers = make_input(tokens=10, width=1, delimiter_length=2, mixed_position=0.5)
+        self.assertTrue(numbers.startswith("//**\n"))
+        with self.assertRaises(ValueError) as ctx:
+            add_v8(numbers)
+        self.assertIn("'**' expected but ',' found", str(ctx.exception))
+
+    def test_given_negative_ratio_when_make_input_called_then_negates_numbers(self):
+        """Should negate every number when the ratio is 1."""
+        numbers = make_input(tokens=20, negative_ratio=1.0)
+        self.assertTrue(all(token.startswith("-") for token in numbers.split(",")))
+
+    def test_given_custom_delimiter_when_supports_called_then_only_v5_and_later(self):
+        """Versions before 5 do not understand the ``//`` header."""
+        shape = {
+            "tokens": 100,
+            "width": 3,
+            "delimiter_length": 1,
+            "negative_ratio": 0.0,
+            "mixed_position": None,
+        }
+        self.assertFalse(supports(4, shape))
+        self.assertTrue(supports(5, shape))
+
+
+class TestCommandLine(unittest.TestCase):
+    """
+    The ``run`` and ``compare`` subcommands work end to end.
+    """
+
+    def test_given_small_run_when_main_called_then_writes_json_and_compares_clean(
+        self,
+    ):
+        """Should write a JSON report that compares against itself without regressions."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "bench.json")
+            main(
+                [
+                    "run",
+                    "--tokens",
+                    "10",
+                    "--widths",
+                    "2",
+                    "--delimiter-lengths",
+                    "0",
+                    "1",
+                    "--negative-ratios",
+                    "0",
+                    "--mixed-positions",
+                    "none",
+                    "--functions",
+                    "add_v7",
+                    "add_v8",
+                    "--repeat",
+                    "1",
+                    "--output",
+                    output,
+                ]
+            )
+            with open(output, encoding="utf-8") as report:
+                results = json.load(report)["results"]
+            self.assertEqual(len(results), 4)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(["compare", output, output]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,28 @@ Test-Driven Development solution for FizzBuzz.
 Siguiendo el manifiesto TDD con iteraciones incrementales.
 """
 
+import io
+import os
+import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
 from tddmanifiesto.class_fizzbuzz import (
+    FIZZ_BUZZ_RULES,
+    FIZZ_BUZZ_VARIANTS,
+    FizzBuzzDispatcher,
+    FizzBuzzRules,
     fizz_buzz,
+    fizz_buzz_line_at,
+    fizz_buzz_offset,
+    fizz_buzz_parallel,
+    fizz_buzz_range,
+    iter_fizz_buzz_blocks,
     iteration1_fizzbuzz,
     iteration2_fizzbuzz,
     iteration3_fizzbuzz,
+    read_fizz_buzz,
+    write_fizz_buzz,
 )
 
 
@@ -84,5 +99,247 @@ class TestFizzBuzzFinal(unittest.TestCase):
         self.assertEqual(fizz_buzz(15), "FizzBuzz")
 
 
+class TestFizzBuzzRange(unittest.TestCase):
+    """
+    Rangos completos renderizados con el patrón que se repite cada 15.
+    """
+
+    def test_rango_coincide_con_fizz_buzz_linea_a_linea(self):
+        """
+        Check if the joined block has one fizz_buzz line per number.
+        """
+        esperado = "".join(fizz_buzz(n) + "\n" for n in range(-20, 101))
+        self.assertEqual(fizz_buzz_range(-20, 101), esperado)
+
+    def test_rango_perezoso_retorna_etiquetas(self):
+        """
+        Check if the lazy iterator yields the same labels as fizz_buzz.
+        """
+        etiquetas = fizz_buzz_range(1, 16, lazy=True)
+        self.assertEqual(list(etiquetas), [fizz_buzz(n) for n in range(1, 16)])
+
+    def test_bloques_pequenos_no_cambian_la_salida(self):
+        """
+        Check if blocks that break the 15-cycle still join to the same output.
+        """
+        self.assertEqual(
+            "".join(iter_fizz_buzz_blocks(7, 70, block_size=4)),
+            fizz_buzz_range(7, 70),
+        )
+
+    def test_rango_vacio_retorna_texto_vacio(self):
+        """
+        Check if an empty range renders nothing.
+        """
+        self.assertEqual(fizz_buzz_range(5, 5), "")
+        self.assertEqual(list(fizz_buzz_range(5, 1, lazy=True)), [])
+
+
+class TestFizzBuzzRules(unittest.TestCase):
+    """
+    Motor de reglas con tabla del ciclo mcm y criba para ciclos grandes.
+    """
+
+    def test_reglas_clasicas_coinciden_con_fizz_buzz(self):
+        """
+        Check if the 3/5 rules reproduce fizz_buzz.
+        """
+        for n in range(-30, 100):
+            self.assertEqual(FIZZ_BUZZ_RULES(n), fizz_buzz(n))
+
+    def test_reglas_personalizadas_concatenan_en_orden(self):
+        """
+        Check if custom rules join their words in the given order.
+        """
+        reglas = FizzBuzzRules([(2, "Foo"), (7, "Bar")])
+        self.assertEqual(reglas(14), "FooBar")
+        self.assertEqual(reglas(7), "Bar")
+        self.assertEqual(reglas(9), "9")
+
+    def test_ciclo_grande_usa_criba_con_el_mismo_resultado(self):
+        """
+        Check if the sieve fallback matches the cycle table.
+        """
+        reglas = [(4, "a"), (6, "b"), (9, "c")]
+        tabla = FizzBuzzRules(reglas)
+        criba = FizzBuzzRules(reglas, max_cycle=1)
+        self.assertIsNone(criba.table)
+        self.assertEqual(criba.labels(-40, 80), tabla.labels(-40, 80))
+        self.assertEqual(criba(36), tabla(36))
+        self.assertEqual(criba.labels(5, 2), [])
+        self.assertEqual(tabla.labels(5, 2), [])
+
+    def test_divisor_cero_lanza_valueerror(self):
+        """
+        Check if a zero divisor is rejected.
+        """
+        with self.assertRaises(ValueError):
+            FizzBuzzRules([(0, "Zero")])
+
+
+class TestWriteFizzBuzz(unittest.TestCase):
+    """
+    Escritura directa a archivos y descriptores con un búfer fijo.
+    """
+
+    def test_escribe_en_archivo_binario_lo_mismo_que_el_rango(self):
+        """
+        Check if writing to a binary file matches fizz_buzz_range.
+        """
+        salida = io.BytesIO()
+        escritos = write_fizz_buzz(salida, 1, 5000, buffer_size=256)
+        self.assertEqual(salida.getvalue(), fizz_buzz_range(1, 5000).encode())
+        self.assertEqual(escritos, len(salida.getvalue()))
+
+    def test_escribe_en_descriptor_de_archivo(self):
+        """
+        Check if writing to a raw file descriptor produces the same bytes.
+        """
+        with tempfile.TemporaryFile() as archivo:
+            write_fizz_buzz(archivo.fileno(), -20, 300)
+            os.lseek(archivo.fileno(), 0, os.SEEK_SET)
+            self.assertEqual(archivo.read(), fizz_buzz_range(-20, 300).encode())
+
+    def test_bufer_menor_que_un_ciclo_sigue_funcionando(self):
+        """
+        Check if a buffer smaller than one 15-line cycle still writes everything.
+        """
+        salida = io.BytesIO()
+        write_fizz_buzz(salida, 1, 100, buffer_size=8)
+        self.assertEqual(salida.getvalue(), fizz_buzz_range(1, 100).encode())
+
+
+class TestFizzBuzzParallel(unittest.TestCase):
+    """
+    Generación en trozos sobre un pool de procesos, reensamblada en orden.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Comparte un pool pequeño entre las pruebas.
+        """
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Cierra el pool compartido.
+        """
+        cls.executor.shutdown()
+
+    def test_salida_paralela_identica_a_la_secuencial(self):
+        """
+        Check if the joined chunks are byte-identical to the sequential output.
+        """
+        for chunk_size in (1, 7, 15, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                trozos = fizz_buzz_parallel(
+                    -10, 400, chunk_size=chunk_size, executor=self.executor
+                )
+                self.assertEqual(b"".join(trozos), fizz_buzz_range(-10, 400).encode())
+
+    def test_trozos_llegan_en_orden(self):
+        """
+        Check if each chunk holds the lines of its own sub-range.
+        """
+        trozos = list(fizz_buzz_parallel(1, 31, workers=1, chunk_size=10))
+        self.assertEqual(trozos[1], fizz_buzz_range(11, 21).encode())
+        self.assertEqual(len(trozos), 3)
+
+
+class TestFizzBuzzIndex(unittest.TestCase):
+    """
+    Acceso directo a líneas y bytes de la salida sin generarla completa.
+    """
+
+    def test_offset_coincide_con_la_salida_generada(self):
+        """
+        Check if each line starts where the rendered output puts it.
+        """
+        salida = fizz_buzz_range(1, 1200)
+        posicion = 0
+        for n in range(1, 1200):
+            self.assertEqual(fizz_buzz_offset(n), posicion)
+            posicion += len(fizz_buzz(n)) + 1
+        self.assertEqual(posicion, len(salida))
+
+    def test_linea_en_offset_es_la_inversa(self):
+        """
+        Check if every byte of a line maps back to that line, across digit ranges.
+        """
+        for n in (1, 9, 10, 15, 99, 100, 101, 10**12 - 1, 10**12):
+            inicio = fizz_buzz_offset(n)
+            fin = inicio + len(fizz_buzz(n))
+            self.assertEqual(fizz_buzz_line_at(inicio), n)
+            self.assertEqual(fizz_buzz_line_at(fin), n)
+            self.assertEqual(fizz_buzz_line_at(fin + 1), n + 1)
+
+    def test_lectura_de_un_tramo_lejano(self):
+        """
+        Check if reading far into the virtual output renders only what is asked.
+        """
+        n = 10**15 + 3
+        inicio = fizz_buzz_offset(n)
+        esperado = fizz_buzz_range(n, n + 10).encode()
+        self.assertEqual(read_fizz_buzz(inicio + 2, 30), esperado[2:32])
+
+    def test_valores_fuera_de_rango_lanzan_valueerror(self):
+        """
+        Check if lines before 1 and negative offsets are rejected.
+        """
+        with self.assertRaises(ValueError):
+            fizz_buzz_offset(0)
+        with self.assertRaises(ValueError):
+            fizz_buzz_line_at(-1)
+
+
+class TestFizzBuzzDispatcher(unittest.TestCase):
+    """
+    Despachador por nombre con caché acotada y métricas por variante.
+    """
+
+    def test_registra_las_cinco_variantes(self):
+        """
+        Check if every FizzBuzz variant in the repo is available by name.
+        """
+        despachador = FizzBuzzDispatcher()
+        self.assertEqual(despachador.names(), list(FIZZ_BUZZ_VARIANTS))
+        for nombre, funcion in FIZZ_BUZZ_VARIANTS.items():
+            self.assertEqual(despachador(nombre, 30), funcion(30))
+
+    def test_numeros_pequenos_repetidos_salen_de_la_cache(self):
+        """
+        Check if repeated small n hit the memo cache and large n bypass it.
+        """
+        despachador = FizzBuzzDispatcher(memo_limit=100)
+        for _ in range(3):
+            despachador("fizz_buzz", 15)
+        despachador("fizz_buzz", 10**6)
+        stats = despachador.stats("fizz_buzz")
+        self.assertEqual(stats["calls"], 4)
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertEqual(sum(stats["latency_ns"].values()), 4)
+
+    def test_reemplazar_variante_no_cambia_las_llamadas(self):
+        """
+        Check if re-registering a name redirects callers holding the variant.
+        """
+        despachador = FizzBuzzDispatcher()
+        iteracion = despachador.variant("iteration1")
+        self.assertEqual(iteracion(5), "5")
+        despachador.register("iteration1", fizz_buzz)
+        self.assertEqual(iteracion(5), "Buzz")
+
+    def test_variante_desconocida_lanza_keyerror(self):
+        """
+        Check if an unknown name raises KeyError.
+        """
+        despachador = FizzBuzzDispatcher()
+        despachador.unregister("iteration2")
+        with self.assertRaises(KeyError):
+            despachador("iteration2", 3)
+
+
 if __name__ == "__main__":
     unittest.main()
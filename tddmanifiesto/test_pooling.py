@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the shared process pool helpers.
+Tests are named following the Given-When-Then convention (TDD Manifesto).
+"""
+
+import unittest
+from concurrent.futures import Future
+
+from tddmanifiesto.pooling import ordered_submit, pool_window, process_pool
+
+
+# pylint: disable=too-few-public-methods
+class RecordingExecutor:
+    """Runs tasks on submit and records how many were submitted."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, function, *args):
+        """Run ``function`` now and return its completed future."""
+        self.submitted += 1
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+class TestOrderedSubmit(unittest.TestCase):
+    """
+    Results come back in task order with a bounded number in flight.
+    """
+
+    def test_given_tasks_when_submitted_then_yields_results_in_order(self):
+        """Each result matches its task, in the order the tasks were given."""
+        tasks = ((n, n + 1) for n in range(10))
+        results = ordered_submit(RecordingExecutor(), pow, tasks, window=3)
+        self.assertEqual(list(results), [n ** (n + 1) for n in range(10)])
+
+    def test_given_window_when_results_consumed_then_submits_at_most_window_ahead(
+        self,
+    ):
+        """Tasks are only submitted as earlier results are taken."""
+        executor = RecordingExecutor()
+        results = ordered_submit(executor, abs, ((-n,) for n in range(100)), window=4)
+        for taken in range(1, 101):
+            next(results)
+            self.assertLessEqual(executor.submitted - taken, 4)
+
+    def test_given_executor_when_pool_opened_then_is_reused_and_left_open(self):
+        """A caller's executor is returned as is; the window is two per worker."""
+        executor = RecordingExecutor()
+        with process_pool(executor=executor) as pool:
+            self.assertIs(pool, executor)
+        self.assertEqual(pool_window(3), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
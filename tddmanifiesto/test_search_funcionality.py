@@ -7,13 +7,22 @@ Estructura de nombres Given-When-Then.
 # pylint: disable=import-error
 import pytest
 
+from tddmanifiesto import class_search_funcionality
 from tddmanifiesto.class_search_funcionality import (
     CITY_DB,
+    CityDatabase,
+    CityIndex,
+    CityTable,
+    PrefixIndex,
+    SearchCache,
+    build_city_table,
     iteration1_search,
     iteration2_search,
     iteration3_search,
     iteration4_search,
     iteration5_search,
+    prefix_search,
+    ranked_search,
     search_cities,
 )
 
@@ -110,3 +119,298 @@ def test_given_various_search_inputs_when_final_search_called_then_returns_expec
     """Versión final refactorizada: combina todas las reglas."""
     result = search_cities(search_text)
     assert sorted(result) == sorted(expected)
+
+
+def linear_search(cities, search_text):
+    """Búsqueda lineal de referencia con las reglas de search_cities."""
+    if search_text == "*":
+        return cities
+    if len(search_text) < 2:
+        return []
+    search_text = search_text.lower()
+    return [city for city in cities if search_text in city.lower()]
+
+
+@pytest.mark.parametrize(
+    "search_text",
+    ["va", "VA", "on", "ndo", "new york", "an", "zz", "dam", "ONG K", "a", "*"],
+)
+def test_given_any_query_when_final_search_called_then_matches_linear_scan_order(
+    search_text,
+):
+    """El índice devuelve lo mismo y en el mismo orden que el recorrido lineal."""
+    assert search_cities(search_text) == linear_search(CITY_DB, search_text)
+
+
+@pytest.mark.parametrize(
+    "search_text",
+    ["ab", "abc", "bca", "abab", "ßé", "SSÉ", "İ", "xyz"],
+)
+def test_given_custom_cities_when_index_searched_then_matches_linear_scan(
+    search_text,
+):
+    """Consultas de dos, tres y más caracteres, con mayúsculas y Unicode."""
+    cities = ["abc", "Cabca", "ABAB", "straße", "Straßé", "İstanbul", "bcab"]
+    index = CityIndex(cities)
+    assert index.search(search_text) == linear_search(cities, search_text)
+
+
+def test_given_city_db_changes_when_final_search_called_then_index_is_rebuilt(
+    monkeypatch,
+):
+    """Reemplazar o modificar CITY_DB invalida el índice."""
+    monkeypatch.setattr(
+        class_search_funcionality, "CITY_DB", CityDatabase(["Oslo", "Lisbon"])
+    )
+    assert search_cities("lo") == ["Oslo"]
+    class_search_funcionality.CITY_DB.append("Bilbao")
+    assert search_cities("lb") == ["Bilbao"]
+    class_search_funcionality.CITY_DB[0] = "Porto"
+    assert search_cities("lo") == []
+
+
+def test_given_city_db_appended_when_searched_then_indexes_are_updated_in_place(
+    monkeypatch,
+):
+    """Las altas al final se agregan a los índices existentes sin reconstruirlos."""
+    monkeypatch.setattr(
+        class_search_funcionality, "CITY_DB", CityDatabase(["Oslo", "Lisbon"])
+    )
+    index = class_search_funcionality.city_index()
+    prefixes = class_search_funcionality.prefix_index()
+    class_search_funcionality.CITY_DB.append("Lorca")
+    class_search_funcionality.CITY_DB += ["Lodz"]
+    assert search_cities("lo") == ["Oslo", "Lorca", "Lodz"]
+    assert prefix_search("Lo") == ["Lodz", "Lorca"]
+    assert class_search_funcionality.city_index() is index
+    assert class_search_funcionality.prefix_index() is prefixes
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda cities: cities.insert(1, "Lorca"),
+        lambda cities: cities.remove("Oslo"),
+        lambda cities: cities.pop(),
+        lambda cities: cities.__setitem__(0, "Porto"),
+        lambda cities: cities.__setitem__(slice(0, 2), ["Lorca"]),
+        lambda cities: cities.__delitem__(slice(1, None)),
+        lambda cities: cities.sort(),
+        lambda cities: cities.reverse(),
+        lambda cities: cities.clear(),
+        lambda cities: cities.__imul__(2),
+    ],
+)
+def test_given_city_db_changed_when_searched_then_matches_a_fresh_index(
+    monkeypatch, change
+):
+    """Cualquier cambio deja los índices igual que si se construyeran de nuevo."""
+    cities = CityDatabase(["Oslo", "Lisbon", "Bilbao", "Lorca"])
+    monkeypatch.setattr(class_search_funcionality, "CITY_DB", cities)
+    search_cities("lo")
+    prefix_search("Lo")
+    change(cities)
+    for search_text in ["lo", "bo", "or", "Lo", "Po"]:
+        assert search_cities(search_text) == linear_search(cities, search_text)
+        assert prefix_search(search_text) == PrefixIndex(list(cities)).search(
+            search_text
+        )
+
+
+def test_given_plain_list_edited_in_place_when_searched_then_results_are_current(
+    monkeypatch,
+):
+    """
+    Cambiar un extremo de una lista común invalida el índice aunque no cambie
+    su largo; el resto de las ediciones en el lugar solo las sigue CityDatabase.
+    """
+    monkeypatch.setattr(class_search_funcionality, "CITY_DB", ["Oslo", "Lisbon"])
+    assert search_cities("lo") == ["Oslo"]
+    assert prefix_search("Os") == ["Oslo"]
+    class_search_funcionality.CITY_DB[0] = "Porto"
+    assert search_cities("lo") == []
+    assert search_cities("rt") == ["Porto"]
+    assert prefix_search("Os") == []
+
+
+@pytest.mark.parametrize("search_text", ["Va", "va", "Ro", "Am", "V", "Hong K", "zz"])
+def test_given_prefix_when_prefix_search_called_then_matches_iterations_2_and_3(
+    search_text,
+):
+    """Mismos resultados que iteration2_search e iteration3_search, ordenados."""
+    assert prefix_search(search_text) == sorted(iteration2_search(search_text))
+    assert sorted(prefix_search(search_text, case_sensitive=False)) == sorted(
+        iteration3_search(search_text)
+    )
+
+
+def test_given_inserts_and_deletes_when_prefix_index_searched_then_reflects_changes():
+    """Altas y bajas incrementales, con nombres repetidos."""
+    index = PrefixIndex(["Bilbao", "bilbao", "Berlin"])
+    index.insert("Bilbo")
+    assert index.search("Bil") == ["Bilbao", "Bilbo"]
+    assert index.search("bil", case_sensitive=False) == ["Bilbao", "bilbao", "Bilbo"]
+    index.delete("Bilbao")
+    assert index.search("BIL", case_sensitive=False) == ["bilbao", "Bilbo"]
+    assert len(index) == 3
+    with pytest.raises(ValueError):
+        index.delete("Madrid")
+
+
+@pytest.mark.parametrize("prefix", ["", "\U0010ffff", "a\U0010ffff"])
+def test_given_edge_prefixes_when_prefix_index_searched_then_bounds_are_exact(prefix):
+    """El prefijo vacío y el último carácter Unicode no cortan mal el tramo."""
+    names = ["a", "a\U0010ffff", "a\U0010ffffz", "b", "\U0010ffff"]
+    index = PrefixIndex(names)
+    assert index.search(prefix) == sorted(n for n in names if n.startswith(prefix))
+
+
+def test_given_keystrokes_when_cache_searched_then_narrows_previous_results(
+    monkeypatch,
+):
+    """Cada tecla reutiliza el resultado de la consulta anterior."""
+    cities = CityDatabase(["Amsterdam", "Mstow", "Steyr", "Amsa", "Amstel", "Rome"])
+    monkeypatch.setattr(class_search_funcionality, "CITY_DB", cities)
+    cache = SearchCache()
+    for search_text in ["am", "ams", "amst", "amste", "amster"]:
+        assert cache.search(search_text) == linear_search(cities, search_text)
+    assert cache.info()["narrowed"] >= 1
+    assert cache.search("AMS") == linear_search(cities, "ams")
+    assert cache.info()["hits"] == 1
+
+
+def test_given_full_cache_when_new_query_searched_then_evicts_least_recent():
+    """La caché guarda a lo sumo ``maxsize`` consultas."""
+    cache = SearchCache(maxsize=2)
+    cache.search("va")
+    cache.search("ro")
+    cache.search("va")
+    cache.search("on")
+    assert cache.info()["size"] == 2
+    cache.search("ro")
+    assert cache.info()["hits"] == 1
+
+
+def test_given_city_db_changes_when_cache_searched_then_results_are_refreshed(
+    monkeypatch,
+):
+    """Modificar CITY_DB descarta los resultados guardados."""
+    monkeypatch.setattr(
+        class_search_funcionality, "CITY_DB", CityDatabase(["Oslo", "Lisbon"])
+    )
+    cache = SearchCache()
+    assert cache.search("lo") == ["Oslo"]
+    class_search_funcionality.CITY_DB.append("Lorca")
+    assert cache.search("lo") == ["Oslo", "Lorca"]
+
+
+RANKED_CITIES = ["Rotterdam", "Roma", "Rom", "Bucharest", "Rome", "Ceprom"]
+
+
+@pytest.mark.parametrize(
+    "weights, expected",
+    [
+        (None, ["Rom", "Roma", "Rome", "Ceprom"]),
+        ({"Rome": 5, "Ceprom": 9}, ["Rom", "Rome", "Roma", "Ceprom"]),
+    ],
+)
+def test_given_query_when_ranked_search_called_then_orders_exact_prefix_substring(
+    monkeypatch, weights, expected
+):
+    """Exacta, prefijo y subcadena; la popularidad desempata dentro de cada grupo."""
+    monkeypatch.setattr(
+        class_search_funcionality, "CITY_DB", CityDatabase(RANKED_CITIES)
+    )
+    page = ranked_search("rom", weights=weights)
+    assert page == {"results": expected, "next_cursor": None}
+
+
+def test_given_limit_when_ranked_search_paginates_then_offset_and_cursor_agree(
+    monkeypatch,
+):
+    """Las páginas por offset y por cursor recorren el mismo orden."""
+    monkeypatch.setattr(
+        class_search_funcionality, "CITY_DB", CityDatabase(RANKED_CITIES)
+    )
+    first = ranked_search("ro", limit=2)
+    assert first["results"] == ["Rotterdam", "Roma"]
+    second = ranked_search("ro", limit=2, cursor=first["next_cursor"])
+    assert second["results"] == ranked_search("ro", limit=2, offset=2)["results"]
+    last = ranked_search("ro", limit=2, cursor=second["next_cursor"])
+    assert last == {"results": ["Ceprom"], "next_cursor": None}
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [{"Axab": 2**60 + 1, "Bxab": 2**60}, {"Axab": 1.5, "Bxab": 0.5}],
+)
+def test_given_large_or_float_weights_when_cursor_paginates_then_matches_offset(
+    monkeypatch, weights
+):
+    """El cursor guarda el peso sin redondear, sea entero grande o float."""
+    monkeypatch.setattr(
+        class_search_funcionality, "CITY_DB", CityDatabase(["Bxab", "Axab", "Cxab"])
+    )
+    first = ranked_search("xab", limit=1, weights=weights)
+    assert first["results"] == ["Axab"]
+    second = ranked_search("xab", limit=1, weights=weights, cursor=first["next_cursor"])
+    assert second["results"] == ["Bxab"]
+    assert (
+        second["results"]
+        == ranked_search("xab", limit=1, offset=1, weights=weights)["results"]
+    )
+
+
+def test_given_asterisk_or_short_text_when_ranked_search_called_then_follows_kata_rules():
+    """'*' devuelve todas las ciudades por página; menos de 2 caracteres, nada."""
+    assert ranked_search("*", limit=3)["results"] == CITY_DB[:3]
+    assert ranked_search("a")["results"] == []
+    with pytest.raises(ValueError):
+        ranked_search("ro", cursor="not-a-cursor")
+
+
+@pytest.fixture(name="city_table")
+def fixture_city_table(tmp_path):
+    """Tabla en disco creada desde un CSV con las ciudades de la kata."""
+    source = tmp_path / "cities.csv"
+    rows = ["id,name"] + [
+        f'{position},"{city}"' for position, city in enumerate(CITY_DB)
+    ]
+    source.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    table_path = tmp_path / "cities.sst"
+    assert build_city_table(str(source), str(table_path), column="name") == len(CITY_DB)
+    with CityTable(str(table_path)) as table:
+        yield table
+
+
+@pytest.mark.parametrize(
+    "search_text", ["*", "", "v", "va", "VA", "ape", "on", "dam", "zzz"]
+)
+def test_given_mapped_table_when_searched_then_matches_search_cities(
+    city_table, search_text
+):
+    """La tabla en disco devuelve lo mismo y en el mismo orden que search_cities."""
+    assert city_table.search(search_text) == search_cities(search_text)
+
+
+def test_given_text_file_when_table_built_then_prefix_search_is_sorted(tmp_path):
+    """Un nombre por línea; el prefijo ignora mayúsculas y respeta bordes."""
+    source = tmp_path / "cities.txt"
+    source.write_text("Roma\nRotterdam\nÅrhus\nrom\nRo\nBerlin\n", encoding="utf-8")
+    table_path = tmp_path / "cities.sst"
+    build_city_table(str(source), str(table_path))
+    with CityTable(str(table_path)) as table:
+        assert len(table) == 6
+        assert table.prefix("RO") == ["Ro", "rom", "Roma", "Rotterdam"]
+        assert table.prefix("rom") == ["rom", "Roma"]
+        assert table.prefix("å") == ["Århus"]
+        assert table.prefix("x") == []
+        assert table.search("mb") == []
+
+
+def test_given_other_file_when_table_opened_then_raises_value_error(tmp_path):
+    """Un archivo sin la firma de la tabla se rechaza."""
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"not a city table")
+    with pytest.raises(ValueError):
+        CityTable(str(other))
@@ -5,9 +5,20 @@ Each test class corresponds to a version (requirement) of the add function.
 Tests are named following the Given-When-Then convention (TDD Manifesto).
 """
 
+import io
+import pickle
 import unittest
-
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from tddmanifiesto import class_stringcalculator
+from tddmanifiesto.class_stringcalculator import (
+    DELIMITER_SPECS,
+    DelimiterAutomaton,
+    StringCalculatorAccumulator,
+)
 from tddmanifiesto.class_stringcalculator import add as add_version1
+from tddmanifiesto.class_stringcalculator import add_many
 from tddmanifiesto.class_stringcalculator import add_v2 as add_version2
 from tddmanifiesto.class_stringcalculator import add_v3 as add_version3
 from tddmanifiesto.class_stringcalculator import add_v4 as add_version4
@@ -15,6 +26,8 @@ from tddmanifiesto.class_stringcalculator import add_v5 as add_version5
 from tddmanifiesto.class_stringcalculator import add_v6 as add_version6
 from tddmanifiesto.class_stringcalculator import add_v7 as add_version7
 from tddmanifiesto.class_stringcalculator import add_v8 as add_version8
+from tddmanifiesto.class_stringcalculator import add_v8_parallel, add_v8_stream
+from tddmanifiesto.class_stringcalculator import add_v9 as add_version9
 
 
 class TestVersion1(unittest.TestCase):
@@ -392,6 +405,497 @@ class TestVersion8(unittest.TestCase):
             add_version8("//|\n1|2|-3")
         self.assertIn("Negative number(s) not allowed: -3", str(ctx.exception))
 
+    def test_given_multichar_delimiter_and_stray_comma_when_add_called_then_reports_position(
+        self,
+    ):
+        """Should report the position of the first comma outside the custom delimiter."""
+        with self.assertRaises(ValueError) as ctx:
+            add_version8("//sep\n1sep2,3sep4")
+        self.assertEqual(
+            str(ctx.exception), "'sep' expected but ',' found at position 5."
+        )
+
+    def test_given_delimiter_containing_comma_when_add_called_then_skips_covered_commas(
+        self,
+    ):
+        """Commas that are part of the custom delimiter are not mixed delimiters."""
+        with self.assertRaises(ValueError) as ctx:
+            add_version8("//,;\n1,;2,3")
+        self.assertEqual(
+            str(ctx.exception), "',;' expected but ',' found at position 4."
+        )
+
+    def test_given_large_input_when_add_called_then_returns_sum_in_linear_time(self):
+        """Should sum a large custom-delimited payload without quadratic rescans."""
+        numbers = "//;\n" + ";".join(str(i % 1500) for i in range(200000))
+        expected = sum(i % 1500 for i in range(200000) if i % 1500 <= 1000)
+        self.assertEqual(add_version8(numbers), expected)
+
+
+class TestVersion8Stream(unittest.TestCase):
+    """
+    Streaming Version 8: same results as add_v8 for files, readers and chunk iterables.
+    """
+
+    CASES = [
+        "",
+        "1,2\n3",
+        "1,2,",
+        "1,-2,3",
+        "//;\n1;2;1001",
+        "//sep\n2sep5",
+        "//|\n1|2,-3",
+        "//,;\n1,;2,3",
+        "//;\n1;2;",
+    ]
+
+    def assert_same_as_add_v8(self, numbers, source):
+        """Compare the streaming result (or error) against add_v8."""
+        try:
+            expected = add_version8(numbers)
+        except ValueError as error:
+            with self.assertRaises(ValueError) as ctx:
+                add_v8_stream(source)
+            self.assertEqual(str(ctx.exception), str(error))
+        else:
+            self.assertEqual(add_v8_stream(source), expected)
+
+    def test_given_chunks_split_at_every_position_when_streamed_then_matches_add_v8(
+        self,
+    ):
+        """Headers, numbers and delimiters split across chunk edges give the same result."""
+        for numbers in self.CASES:
+            for size in range(1, len(numbers) + 1):
+                chunks = [numbers[i : i + size] for i in range(0, len(numbers), size)]
+                with self.subTest(numbers=numbers, size=size):
+                    self.assert_same_as_add_v8(numbers, chunks)
+
+    def test_given_text_file_when_streamed_then_matches_add_v8(self):
+        """Should read a text file object in fixed-size chunks."""
+        for numbers in self.CASES:
+            with self.subTest(numbers=numbers):
+                self.assert_same_as_add_v8(numbers, io.StringIO(numbers))
+
+    def test_given_binary_reader_when_streamed_then_decodes_and_matches_add_v8(self):
+        """Should decode bytes from a binary reader, even one byte at a time."""
+        numbers = "//é\n1é2é3"
+        self.assertEqual(add_v8_stream(io.BytesIO(numbers.encode()), chunk_size=1), 6)
+
+    def test_given_header_without_newline_when_streamed_then_raises_valueerror(self):
+        """Should fail like add_v8 when the custom header is never terminated."""
+        with self.assertRaises(ValueError):
+            add_v8_stream(["//", ";"])
+
+
+class TestDelimiterSpecCache(unittest.TestCase):
+    """
+    Compiled delimiter specs are cached per header and shared by versions 5 to 8.
+    """
+
+    def setUp(self):
+        """Start every test with an empty default-size cache."""
+        DELIMITER_SPECS.resize(128)
+
+    def tearDown(self):
+        """Leave the shared cache at its default size."""
+        DELIMITER_SPECS.resize(128)
+
+    def test_given_repeated_header_when_add_called_then_reuses_compiled_spec(self):
+        """Should compile a header once and count later lookups as hits."""
+        add_version8("//;\n1;2")
+        add_version5("//;\n3;4")
+        add_version8("//;\n5;6")
+        info = DELIMITER_SPECS.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+    def test_given_small_cache_when_headers_alternate_then_evicts_least_recent(self):
+        """Should keep at most ``maxsize`` specs once resized."""
+        DELIMITER_SPECS.resize(1)
+        for numbers in ("//;\n1;2", "//|\n1|2", "//;\n1;2"):
+            self.assertEqual(add_version7(numbers), 3)
+        info = DELIMITER_SPECS.info()
+        self.assertEqual((info.hits, info.misses, info.maxsize), (0, 3, 1))
+
+    def test_given_cached_specs_when_cleared_then_cache_is_empty(self):
+        """Should drop cached specs and statistics on clear."""
+        add_version6("//;\n1;2")
+        DELIMITER_SPECS.clear()
+        info = DELIMITER_SPECS.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+
+class TestAddMany(unittest.TestCase):
+    """
+    Batch Version 8: one sum or error object per input, without stopping at bad items.
+    """
+
+    def test_given_valid_inputs_when_add_many_called_then_returns_sums_in_order(self):
+        """Should return the add_v8 sum of every input, in input order."""
+        self.assertEqual(
+            add_many(["", "1,2", "//;\n1;2;1001", "4\n5\n6"]), [0, 3, 3, 15]
+        )
+
+    def test_given_invalid_inputs_when_add_many_called_then_returns_error_objects(self):
+        """Should return the ValueError add_v8 raises instead of raising it."""
+        inputs = ["1,2,", "//|\n1|2,-3", "5", "//;"]
+        results = add_many(inputs)
+        self.assertEqual(results[2], 5)
+        for numbers, result in zip(inputs, results):
+            if isinstance(result, int):
+                continue
+            with self.subTest(numbers=numbers):
+                self.assertIsInstance(result, ValueError)
+                with self.assertRaises(ValueError) as ctx:
+                    add_version8(numbers)
+                self.assertEqual(str(result), str(ctx.exception))
+
+
+class TestNumpyBackend(unittest.TestCase):
+    """
+    Large default-delimiter inputs: the optional NumPy path matches the pure-Python one.
+    """
+
+    NUMBERS = [(i * 37) % 1500 for i in range(5000)]
+
+    def test_given_large_input_when_add_called_then_sums_match_expected(self):
+        """Versions 2, 3 and 8 should give the same sums with or without NumPy."""
+        commas = ",".join(map(str, self.NUMBERS))
+        mixed = commas.replace(",", "\n", 100)
+        expected_v8 = sum(n for n in self.NUMBERS if n <= 1000)
+        for backend in (class_stringcalculator.np, None):
+            with self.subTest(numpy=backend is not None), mock.patch.object(
+                class_stringcalculator, "np", backend
+            ):
+                self.assertEqual(add_version2(commas), sum(self.NUMBERS))
+                self.assertEqual(add_version3(mixed), sum(self.NUMBERS))
+                self.assertEqual(add_version8(mixed), expected_v8)
+
+    def test_given_large_input_with_negatives_when_add_called_then_lists_them_in_order(
+        self,
+    ):
+        """Should report every negative number in input order."""
+        numbers = ",".join(map(str, self.NUMBERS)) + ",-7,12,-3"
+        with self.assertRaises(ValueError) as ctx:
+            add_version8(numbers)
+        self.assertEqual(str(ctx.exception), "Negative number(s) not allowed: -7, -3")
+
+    def test_given_large_input_with_irregular_tokens_when_add_called_then_falls_back(
+        self,
+    ):
+        """Tokens outside the plain ``-?digits`` form keep Python's int() rules."""
+        numbers = ",".join(map(str, self.NUMBERS)) + ", 5,+5,,1_0"
+        expected = sum(n for n in self.NUMBERS if n <= 1000) + 20
+        self.assertEqual(add_version8(numbers), expected)
+        with self.assertRaises(ValueError):
+            add_version3(numbers)
+
+    @unittest.skipIf(class_stringcalculator.np is None, "NumPy is not installed")
+    def test_given_numpy_when_parsing_plain_tokens_then_returns_int64_array(self):
+        """Should parse plain tokens in bulk and reject the ones it cannot handle."""
+        # pylint: disable=protected-access
+        values = class_stringcalculator._numpy_parse("1,-20\n300")
+        self.assertEqual(values.tolist(), [1, -20, 300])
+        self.assertIsNone(class_stringcalculator._numpy_parse("1,2-3"))
+
+
+class TestVersion8Parallel(unittest.TestCase):
+    """
+    Parallel Version 8: sharded evaluation on a process pool gives add_v8's results.
+    """
+
+    CASES = [
+        "1,2\n3,1001,4\n5,6",
+        "1,-2,3\n-4,5,6,7",
+        "//;\n1;2;3;1001;4;5;6",
+        "//sep\n1sep-2sep3sep4sep-5sep6",
+        "//|\n1|2|3|4,5|6|7,-8|9",
+        "//;;\n1;;;2;;3;;4,5",
+        "1,2,3,",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one small pool across the tests."""
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut the shared pool down."""
+        cls.executor.shutdown()
+
+    def test_given_tiny_shards_when_add_parallel_called_then_matches_add_v8(self):
+        """Sums, negatives and global mixed-delimiter positions match add_v8."""
+        for numbers in self.CASES:
+            for shard_size in (1, 3, 1000):
+                with self.subTest(numbers=numbers, shard_size=shard_size):
+                    try:
+                        expected = add_version8(numbers)
+                    except ValueError as error:
+                        with self.assertRaises(ValueError) as ctx:
+                            add_v8_parallel(
+                                numbers, shard_size=shard_size, executor=self.executor
+                            )
+                        self.assertEqual(str(ctx.exception), str(error))
+                    else:
+                        self.assertEqual(
+                            add_v8_parallel(
+                                numbers, shard_size=shard_size, executor=self.executor
+                            ),
+                            expected,
+                        )
+
+    def test_given_stray_comma_in_late_shard_when_add_parallel_called_then_reports_global_position(
+        self,
+    ):
+        """Should map a shard-local comma position back to the whole body."""
+        numbers = "//;\n" + ";".join(["7"] * 50) + ",1"
+        with self.assertRaises(ValueError) as ctx:
+            add_v8_parallel(numbers, workers=2, shard_size=10)
+        self.assertEqual(
+            str(ctx.exception), "';' expected but ',' found at position 99."
+        )
+
+
+class TestFailFastAndValidateOnly(unittest.TestCase):
+    """
+    Versions 4 to 8: early-exit ``fail_fast`` and ``validate_only`` modes.
+    """
+
+    def test_given_valid_input_when_validate_only_then_returns_no_errors(self):
+        """Should return an empty error list for valid input in every version."""
+        for add_version in (
+            add_version4,
+            add_version5,
+            add_version6,
+            add_version7,
+            add_version8,
+        ):
+            with self.subTest(add_version=add_version.__name__):
+                self.assertEqual(add_version("1,2\n3", validate_only=True), [])
+
+    def test_given_trailing_separator_when_validate_only_then_returns_that_error(self):
+        """Should report the trailing separator without summing."""
+        self.assertEqual(
+            add_version4("1,2,", validate_only=True),
+            ["Invalid input: separator at the end"],
+        )
+        self.assertEqual(
+            add_version5("//;\n1;2;", validate_only=True),
+            ["Invalid input: separator at the end"],
+        )
+
+    def test_given_negatives_and_mixed_delimiter_when_validate_only_then_returns_all_errors(
+        self,
+    ):
+        """Should return the same messages the summing mode aggregates."""
+        self.assertEqual(
+            add_version6("1,-2,-3", validate_only=True),
+            ["Negative numbers not allowed: -2, -3"],
+        )
+        self.assertEqual(
+            add_version8("//|\n1|-2,-3", validate_only=True),
+            [
+                "Negative number(s) not allowed: -2, -3",
+                "'|' expected but ',' found at position 4.",
+            ],
+        )
+
+    def test_given_malformed_number_when_validate_only_then_matches_summing_mode(
+        self,
+    ):
+        """Versions 4 to 6 report the int() error that the sum would raise."""
+        cases = (
+            (add_version4, "1,a"),
+            (add_version4, "1,\n2"),
+            (add_version5, "//;\n1,2;3"),
+            (add_version6, "1,x,-2"),
+            (add_version6, "-1,2 3"),
+        )
+        for add_version, numbers in cases:
+            with self.subTest(add_version=add_version.__name__, numbers=numbers):
+                with self.assertRaises(ValueError) as ctx:
+                    add_version(numbers)
+                self.assertEqual(
+                    add_version(numbers, validate_only=True), [str(ctx.exception)]
+                )
+
+    def test_given_several_errors_when_fail_fast_then_raises_only_the_first(self):
+        """Should stop at the first error: mixed delimiters before negatives."""
+        with self.assertRaises(ValueError) as ctx:
+            add_version7("//|\n1|-2,-3", fail_fast=True)
+        self.assertEqual(
+            str(ctx.exception), "'|' expected but ',' found at position 4."
+        )
+        with self.assertRaises(ValueError) as ctx:
+            add_version8("1,-2,-3", fail_fast=True)
+        self.assertEqual(str(ctx.exception), "Negative number(s) not allowed: -2")
+
+    def test_given_several_errors_when_fail_fast_and_validate_only_then_returns_first(
+        self,
+    ):
+        """Should combine both modes and return at most one error."""
+        self.assertEqual(
+            add_version6("1,-2,-3", fail_fast=True, validate_only=True),
+            ["Negative numbers not allowed: -2"],
+        )
+
+    def test_given_valid_input_when_fail_fast_then_returns_sum(self):
+        """Should compute the usual sum when there is nothing to report."""
+        self.assertEqual(add_version8("//;\n1;2;1001", fail_fast=True), 3)
+
+    def test_given_input_split_in_chunks_when_fail_fast_then_sums_like_each_version(
+        self,
+    ):
+        """The single fail_fast pass gives the same sum as the normal path."""
+        inputs = ("1,2\n3,1001,40", "//;\n5;2000;7", "//**\n1**2,3**4")
+        with mock.patch.object(class_stringcalculator, "FAIL_FAST_CHUNK", 3):
+            for add_version in (
+                add_version5,
+                add_version6,
+                add_version7,
+                add_version8,
+            ):
+                for numbers in inputs:
+                    with self.subTest(
+                        add_version=add_version.__name__, numbers=numbers
+                    ):
+                        try:
+                            expected = add_version(numbers)
+                        except ValueError as error:
+                            expected = str(error)
+                        try:
+                            got = add_version(numbers, fail_fast=True)
+                        except ValueError as error:
+                            got = str(error)
+                        self.assertEqual(got, expected)
+
+    def test_given_early_error_when_fail_fast_then_stops_before_the_rest(self):
+        """Only the first piece of a long bad payload is split and parsed."""
+        # pylint: disable=protected-access
+        numbers = "1,-2," + ",".join(["7"] * 1000)
+        with mock.patch.object(
+            class_stringcalculator, "FAIL_FAST_CHUNK", 8
+        ), mock.patch.object(
+            class_stringcalculator,
+            "_chunk_tokens",
+            wraps=class_stringcalculator._chunk_tokens,
+        ) as chunk_tokens:
+            with self.assertRaises(ValueError) as ctx:
+                add_version8(numbers, fail_fast=True)
+        self.assertEqual(str(ctx.exception), "Negative number(s) not allowed: -2")
+        self.assertEqual(chunk_tokens.call_count, 1)
+
+
+class TestStringCalculatorAccumulator(unittest.TestCase):
+    """
+    Incremental Version 8: fragments fed one by one give the add_v8 result on close.
+    """
+
+    def test_given_fragments_when_fed_then_keeps_running_values(self):
+        """Should expose the running sum, negatives and first mixed-delimiter position."""
+        accumulator = StringCalculatorAccumulator()
+        for fragment in ("//", ";\n1;2", "0;-4;5,", "6;1001;7"):
+            accumulator.feed(fragment)
+        self.assertEqual(accumulator.total, 1 + 20 + 5 + 6)
+        self.assertEqual(accumulator.negatives, [-4])
+        self.assertEqual(accumulator.mixed_position, 9)
+
+    def test_given_valid_fragments_when_closed_then_returns_add_v8_sum(self):
+        """Should include the last token on close."""
+        accumulator = StringCalculatorAccumulator()
+        for fragment in ("1,2", "\n3", "00,1001,4"):
+            accumulator.feed(fragment)
+        self.assertEqual(accumulator.close(), add_version8("1,2\n300,1001,4"))
+
+    def test_given_invalid_fragments_when_closed_then_raises_aggregated_error(self):
+        """Should raise the same aggregated message as add_v8."""
+        accumulator = StringCalculatorAccumulator()
+        for fragment in ("//|\n1|", "2,", "-3"):
+            accumulator.feed(fragment)
+        with self.assertRaises(ValueError) as ctx:
+            accumulator.close()
+        self.assertEqual(
+            str(ctx.exception),
+            "Negative number(s) not allowed: -3\n'|' expected but ',' found at position 3.",
+        )
+
+    def test_given_checkpointed_accumulator_when_resumed_then_continues_the_sum(self):
+        """Should survive a pickle round trip in the middle of a number."""
+        accumulator = StringCalculatorAccumulator()
+        accumulator.feed("//;\n10;2")
+        resumed = pickle.loads(pickle.dumps(accumulator))
+        resumed.feed("0;30")
+        self.assertEqual(resumed.close(), 10 + 20 + 30)
+
+    def test_given_many_small_fragments_when_fed_then_cost_stays_linear(self):
+        """Should handle a long stream of fragments without re-reading earlier input."""
+        accumulator = StringCalculatorAccumulator()
+        accumulator.feed("//;\n")
+        for _ in range(50000):
+            accumulator.feed("7;")
+        accumulator.feed("1")
+        self.assertEqual(accumulator.close(), 7 * 50000 + 1)
+
+
+class TestVersion9(unittest.TestCase):
+    """
+    Version 9: Several bracketed delimiters of any length.
+    """
+
+    def test_given_bracketed_delimiters_when_add_called_then_returns_sum(self):
+        """Should split on every delimiter declared in the header."""
+        self.assertEqual(add_version9("//[***][%%]\n1***2%%3"), 6)
+        self.assertEqual(add_version9("//[*][%]\n1*2%3"), 6)
+
+    def test_given_overlapping_delimiters_when_add_called_then_prefers_longest_match(
+        self,
+    ):
+        """Should take the longest delimiter starting at each position."""
+        self.assertEqual(add_version9("//[*][**]\n1**2*3"), 6)
+
+    def test_given_single_delimiter_when_add_called_then_behaves_like_add_v8(self):
+        """Should keep the add_v8 rules for plain and custom-delimiter inputs."""
+        for numbers in ["", "1,2\n3", "//;\n1;2;1001", "//[***]\n1***2"]:
+            with self.subTest(numbers=numbers):
+                expected = add_version8(numbers.replace("[***]", "***"))
+                self.assertEqual(add_version9(numbers), expected)
+
+    def test_given_input_ending_with_any_delimiter_when_add_called_then_raises_valueerror(
+        self,
+    ):
+        """Should reject a body ending with any declared delimiter."""
+        with self.assertRaises(ValueError) as ctx:
+            add_version9("//[***][%%]\n1***2%%")
+        self.assertEqual(str(ctx.exception), "Invalid input: separator at the end")
+
+    def test_given_several_stray_commas_when_add_called_then_reports_every_position(
+        self,
+    ):
+        """Should list the position of each comma that is not a delimiter."""
+        with self.assertRaises(ValueError) as ctx:
+            add_version9("//[***][%%]\n-1,2***3,4")
+        self.assertEqual(
+            str(ctx.exception),
+            "Negative number(s) not allowed: -1\n"
+            "'***' or '%%' expected but ',' found at positions 2, 8.",
+        )
+
+    def test_given_delimiter_containing_comma_when_add_called_then_skips_covered_commas(
+        self,
+    ):
+        """Should only report commas outside a delimiter match."""
+        with self.assertRaises(ValueError) as ctx:
+            add_version9("//[;,][#]\n1;,2#3,4")
+        self.assertIn("found at position 6.", str(ctx.exception))
+
+    def test_given_automaton_when_scanning_then_finds_leftmost_longest_matches(self):
+        """Should agree with a leftmost-longest regular expression scan."""
+        automaton = DelimiterAutomaton(["a", "bc", "abcd", ","])
+        self.assertEqual(
+            list(automaton.separators("xabcx,bcabcd")),
+            [(1, 2), (2, 4), (5, 6), (6, 8), (8, 12)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,13 +5,31 @@ Each test class corresponds to a version (requirement) of the validator function
 Tests are named following the Given-When-Then convention (TDD Manifesto).
 """
 
+import itertools
+import string
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
+from tddmanifiesto import class_validacioncontrasena
+from tddmanifiesto.class_validacioncontrasena import (
+    FEW_DIGITS,
+    NO_SPECIAL,
+    NO_UPPERCASE,
+    PASSWORD_POLICIES,
+    SPECIAL_CHARACTERS,
+    TOO_SHORT,
+    WHITE_BOX_INVALID,
+    PasswordPolicy,
+    password_code,
+    password_errors,
+)
 from tddmanifiesto.class_validacioncontrasena import validate_password_v1 as version1
 from tddmanifiesto.class_validacioncontrasena import validate_password_v2 as version2
 from tddmanifiesto.class_validacioncontrasena import validate_password_v3 as version3
 from tddmanifiesto.class_validacioncontrasena import validate_password_v4 as version4
 from tddmanifiesto.class_validacioncontrasena import validate_password_v5 as version5
+from tddmanifiesto.class_validacioncontrasena import validate_passwords
+from white_box.class_exercises import validate_password
 
 
 class TestVersion1(unittest.TestCase):
@@ -207,6 +225,167 @@ class TestVersion5(unittest.TestCase):
             result["errors"],
         )
 
+    def test_given_non_ascii_password_when_validate_called_then_uses_unicode_classes(
+        self,
+    ):
+        """Unicode digits and uppercase letters count like str.isdigit/isupper do."""
+        self.assertTrue(version5("ñandú²٣Éxito!")["is_valid"])
+        self.assertEqual(
+            version5("ñandú12éxito")["errors"],
+            [
+                "La contraseña debe contener al menos una letra mayúscula",
+                "La contraseña debe contener al menos un carácter especial",
+            ],
+        )
+
+    def test_given_every_special_character_when_validate_called_then_accepts_it(self):
+        """Each character of the special set satisfies the rule on its own."""
+        for special in '!@#$%^&*(),.?":{}|<>':
+            with self.subTest(special=special):
+                self.assertTrue(version5(f"Abcdef12{special}")["is_valid"])
+        self.assertFalse(version5("Abcdef12_")["is_valid"])
+
+
+class TestValidatePasswords(unittest.TestCase):
+    """
+    Bulk validation: compact records in input order, or counts only.
+    """
+
+    PASSWORDS = ["Abcdef1!2", "abc", "Abcdefg12@", "ABCDEFGH", "ñandú²٣Éxito!", ""]
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one small pool across the tests."""
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut the shared pool down."""
+        cls.executor.shutdown()
+
+    def test_given_passwords_when_validated_in_bulk_then_records_match_v5_errors(self):
+        """Each record expands to the errors version 5 reports for that password."""
+        for password, code in zip(self.PASSWORDS, validate_passwords(self.PASSWORDS)):
+            with self.subTest(password=password):
+                self.assertEqual(password_errors(code), version5(password)["errors"])
+
+    def test_given_white_box_rules_when_validated_in_bulk_then_flags_its_failures(self):
+        """A password valid for version 5 can still fail the white_box validator."""
+        codes = list(validate_passwords(["Abcdef1!2", "Abcdefg12@", "abc"]))
+        self.assertEqual(codes[0], 0)
+        self.assertEqual(codes[1], 0)
+        self.assertEqual(
+            codes[2],
+            TOO_SHORT | FEW_DIGITS | NO_UPPERCASE | NO_SPECIAL | WHITE_BOX_INVALID,
+        )
+        self.assertEqual(list(validate_passwords(["ABCDEFG12("])), [WHITE_BOX_INVALID])
+
+    def test_given_ascii_edge_cases_when_validated_in_bulk_then_agrees_with_white_box(
+        self,
+    ):
+        """The ASCII fast path gives white_box's verdict for every special and length."""
+        for special in string.punctuation + " \t":
+            for parts in itertools.product(("", "A"), ("", "b"), ("", "1")):
+                for length in (7, 8, 9):
+                    password = "".join(parts).ljust(length, special)
+                    with self.subTest(password=password):
+                        self.assertEqual(
+                            not password_code(password) & WHITE_BOX_INVALID,
+                            validate_password(password),
+                        )
+
+    def test_given_process_pool_when_validated_in_bulk_then_keeps_input_order(self):
+        """Pooled batches give the same records as the sequential path."""
+        passwords = self.PASSWORDS * 20
+        records = validate_passwords(
+            iter(passwords), batch_size=7, executor=self.executor
+        )
+        self.assertEqual(list(records), list(validate_passwords(passwords)))
+
+    def test_given_counts_only_when_validated_in_bulk_then_returns_totals(self):
+        """The summary counts valid passwords and failures per rule."""
+        summary = validate_passwords(
+            self.PASSWORDS * 3, batch_size=4, counts_only=True, executor=self.executor
+        )
+        self.assertEqual(
+            summary, validate_passwords(self.PASSWORDS * 3, counts_only=True)
+        )
+        self.assertEqual(summary["total"], 18)
+        self.assertEqual(summary["v5_valid"], 9)
+        self.assertEqual(summary["too_short"], 6)
+
+
+class TestPasswordPolicy(unittest.TestCase):
+    """
+    Declarative policies compiled into validator functions.
+    """
+
+    def test_given_version_policies_when_compiled_then_match_version_functions(self):
+        """Each version's policy gives the same result as its function."""
+        versions = {1: version1, 2: version2, 3: version3, 4: version4, 5: version5}
+        for password in ["", "abc", "abcdefgh", "Abcdef12", "Abcdef12!", "ñandú²٣É!"]:
+            for number, function in versions.items():
+                with self.subTest(password=password, version=number):
+                    validator = PASSWORD_POLICIES[number].compile()
+                    self.assertEqual(validator(password), function(password))
+
+    def test_given_first_failure_mode_when_validated_then_reports_cheapest_error(self):
+        """The length rule runs first and stops the evaluation."""
+        validator = PASSWORD_POLICIES[5].compile("first_failure")
+        self.assertEqual(
+            validator("abc"),
+            {
+                "is_valid": False,
+                "errors": ["La contraseña debe tener al menos 8 caracteres"],
+            },
+        )
+        self.assertEqual(
+            validator("abcdefgh1")["errors"],
+            ["La contraseña debe contener al menos un carácter especial"],
+        )
+        self.assertEqual(validator("Abcdef12!"), {"is_valid": True, "errors": []})
+
+    def test_given_custom_policy_when_compiled_then_uses_its_own_values(self):
+        """Messages and checks follow the declared values."""
+        policy = PasswordPolicy(min_length=12, min_digits=3, special="_-")
+        result = policy.compile()("abc_12")
+        self.assertEqual(
+            result["errors"],
+            [
+                "La contraseña debe tener al menos 12 caracteres",
+                "La contraseña debe contener al menos tres números",
+            ],
+        )
+        self.assertTrue(policy.compile()("abcdefghij_123")["is_valid"])
+        self.assertFalse(
+            PasswordPolicy(special=SPECIAL_CHARACTERS).compile()("_")["is_valid"]
+        )
+
+    def test_given_tuned_policy_when_records_compiled_then_follow_the_policy(self):
+        """Bulk records take their thresholds and messages from the policy."""
+        # pylint: disable=protected-access
+        policy = PasswordPolicy(
+            min_length=10, min_digits=3, uppercase=True, special="_"
+        )
+        code = class_validacioncontrasena._compile_code(policy)
+        messages = policy.messages()
+        rules = {
+            TOO_SHORT: "min_length",
+            FEW_DIGITS: "min_digits",
+            NO_UPPERCASE: "uppercase",
+            NO_SPECIAL: "special",
+        }
+        for password in ["", "Abc_12", "Abcdefg_12", "Abcdefg_123", "abcdefgh!123"]:
+            with self.subTest(password=password):
+                record = code(password)
+                errors = [messages[rule] for bit, rule in rules.items() if record & bit]
+                self.assertEqual(errors, policy.compile()(password)["errors"])
+
+    def test_given_unknown_mode_when_compiled_then_raises_valueerror(self):
+        """Only collect_all and first_failure are accepted."""
+        with self.assertRaises(ValueError):
+            PasswordPolicy(min_length=8).compile("fastest")
+
 
 if __name__ == "__main__":
     unittest.main()